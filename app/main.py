@@ -3,29 +3,70 @@ main.py — FastAPI entry point for the Souli Data Ingestion & Retrieval System.
 
 Endpoints:
   GET  /health           — health check
-  POST /process-csv      — upload CSV of YouTube links, extract & upsert to Qdrant
+  POST /process-csv      — upload CSV of YouTube links; extract & upsert to Qdrant in background
+  GET  /ingest-status/ID — poll a background ingest task
+  GET  /download-csv     — CSV export of one finished ingest task (?task_id=ID)
   POST /query            — natural language similarity search
   GET  /collection-info  — Qdrant collection stats
 """
 
-import io
+import asyncio
+import csv
 import logging
+import multiprocessing
 import os
+import re
 import tempfile
-from typing import List
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional
 
-import pandas as pd
 from dotenv import load_dotenv
-from fastapi import FastAPI, File, UploadFile, HTTPException
+from fastapi import BackgroundTasks, FastAPI, File, Form, UploadFile, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, JSONResponse, ORJSONResponse
 from pydantic import BaseModel
 
-from app.services.extractor import process_youtube_url
-from app.services.qdrant_db import upsert_nodes, search_nodes, collection_info, ensure_collection
+from app.services import query_cache
+from app.services.extractor import (
+    process_urls,
+    process_youtube_url,
+    process_youtube_urls_batch,
+    warm_up_llm,
+)
+from app.services.qdrant_db import (
+    BULK_INDEX_THRESHOLD,
+    deferred_indexing,
+    upsert_nodes,
+    search_nodes,
+    collection_info,
+    ensure_collection,
+    embed_text,
+    get_embedder,
+)
 
 load_dotenv(override=True)
 
+# Max YouTube links processed concurrently (bounded to avoid YouTube / LLM rate limits)
+MAX_CONCURRENT_LINKS = int(os.getenv("MAX_CONCURRENT_LINKS", "16"))
+# Worker processes for transcript cleaning + LLM response parsing/validation.
+# Each mostly waits on YouTube / the LLM, so match the link concurrency, not the CPUs.
+EXTRACTION_WORKERS = int(os.getenv("EXTRACTION_WORKERS", str(MAX_CONCURRENT_LINKS)))
+# Transcripts packed into one LLM call (1 = one call per video). Keep
+# LLM_BATCH_SIZE × 12k chars within the model's context window.
+LLM_BATCH_SIZE = int(os.getenv("LLM_BATCH_SIZE", "1"))
+# "process": per-link extraction in the process pool (default)
+# "async":   native asyncio (ainvoke) on the event loop — best for remote LLMs
+EXTRACTION_MODE = os.getenv("EXTRACTION_MODE", "process").lower()
+# Finished ingest tasks stay pollable for this many seconds (and at most this many are kept)
+INGEST_TASK_TTL = int(os.getenv("INGEST_TASK_TTL", "3600"))
+INGEST_TASK_MAX = int(os.getenv("INGEST_TASK_MAX", "1000"))
+# Per-task CSV exports ({task_id}.csv); each is deleted when its task is evicted
+EXPORT_DIR = os.getenv("EXPORT_DIR", "data/exports")
+
 # ── Logging ───────────────────────────────────────────────────────────────────
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
 logging.basicConfig(
@@ -45,6 +86,7 @@ app = FastAPI(
         "from YouTube coaching transcripts and stores them in Qdrant."
     ),
     version="2.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -54,6 +96,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large /query results and /download-csv exports (small bodies pass through)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 
 # ── Request / Response Models ─────────────────────────────────────────────────
 class QueryRequest(BaseModel):
@@ -75,20 +120,125 @@ class ProcessCSVResponse(BaseModel):
     preview: List[dict]
 
 
-# ── Startup ───────────────────────────────────────────────────────────────────
+class IngestTaskResponse(BaseModel):
+    task_id: str
+    status: str
+    total_links: int
+
+
+class IngestStatusResponse(BaseModel):
+    task_id: str
+    status: str  # pending | running | completed | failed
+    total_links: int
+    result: Optional[ProcessCSVResponse] = None
+    error: Optional[str] = None
+
+
+# ── CSV Export Schema ─────────────────────────────────────────────────────────
+EXPORT_FIELDNAMES = [
+    "video_id", "video_url", "main_question", "category",
+    # Diagnostic Layer — deciding factor for energy-node routing
+    "diagnostic_layer.related_inner_issues",
+    "diagnostic_layer.reality_commitment_check",
+    "diagnostic_layer.hidden_benefit",
+    "diagnostic_layer.energy_node",
+    # Response pillars — how to talk after knowing the problem
+    "pillars.intervention_narrative", "pillars.intervention_action", "pillars.intervention_shift",
+    "atmosphere.tone", "atmosphere.pacing",
+    "overflow",
+]
+
+
+# Runs of whitespace in CSV headers → "_" (e.g. "YT  Link" → "yt_link")
+_COLUMN_WS = re.compile(r"\s+")
+
+
+def _flatten(payload: dict) -> dict:
+    """Dot-join nested sub-model dicts into the flat EXPORT_FIELDNAMES layout."""
+    flat = {}
+    for key, value in payload.items():
+        if isinstance(value, dict):
+            for sub_key, sub_value in value.items():
+                flat[f"{key}.{sub_key}"] = sub_value
+        else:
+            flat[key] = value
+    return flat
+
+
+# ── Startup / Shutdown ────────────────────────────────────────────────────────
+# Extraction runs in a process pool so CPU work (cleaning, JSON parsing,
+# validation) never holds the event loop's GIL while /query and /health serve.
+_extraction_pool: Optional[ProcessPoolExecutor] = None
+# Set once an ingest sees BrokenProcessPool (a worker died, e.g. OOM); the next
+# ingest replaces the pool and /health reports "degraded" until then
+_extraction_pool_broken = False
+# Held so the background LLM warm-up task isn't garbage-collected mid-run
+_warm_up_task: Optional[asyncio.Task] = None
+
+
 @app.on_event("startup")
 async def startup_event():
+    global _warm_up_task
+    _get_extraction_pool()
+    logger.info("Started extraction process pool (%d workers)", EXTRACTION_WORKERS)
+
     logger.info("Souli API starting up — ensuring Qdrant collection exists ...")
     try:
         ensure_collection()
     except Exception as exc:
         logger.warning("Could not connect to Qdrant at startup: %s", exc)
 
+    # Load the embedding model now so the first /query doesn't pay for it
+    try:
+        await asyncio.to_thread(get_embedder)
+    except Exception as exc:
+        logger.warning("Could not load embedding model at startup: %s", exc)
+
+    # Prime Ollama's model + SYSTEM_PROMPT prefix cache without delaying startup
+    _warm_up_task = asyncio.create_task(asyncio.to_thread(warm_up_llm))
+
+
+def _get_extraction_pool() -> ProcessPoolExecutor:
+    """Return the extraction pool, replacing it first if an ingest found it broken."""
+    global _extraction_pool, _extraction_pool_broken
+    if _extraction_pool is None or _extraction_pool_broken:
+        if _extraction_pool is not None:
+            logger.warning("Extraction process pool is broken — recreating it")
+            _extraction_pool.shutdown(wait=False, cancel_futures=True)
+        # spawn, not fork: by the first submit this process already runs gRPC,
+        # ONNX Runtime and thread-pool threads, and forking those can deadlock
+        _extraction_pool = ProcessPoolExecutor(
+            max_workers=EXTRACTION_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        _extraction_pool_broken = False
+    return _extraction_pool
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    if _extraction_pool is not None:
+        _extraction_pool.shutdown(wait=False, cancel_futures=True)
+
 
 # ── Health ────────────────────────────────────────────────────────────────────
 @app.get("/health", tags=["System"])
 def health():
-    return {"status": "ok", "service": "souli-ingestion-api"}
+    if _extraction_pool_broken:
+        # Recreated by the next ingest; report it until then
+        return JSONResponse(
+            status_code=503,
+            content={
+                "status": "degraded",
+                "service": "souli-ingestion-api",
+                "extraction_pool": "broken",
+            },
+        )
+    return {
+        "status": "ok",
+        "service": "souli-ingestion-api",
+        "extraction_pool": "running" if _extraction_pool is not None else "stopped",
+    }
 
 
 # ── Collection Info ───────────────────────────────────────────────────────────
@@ -101,118 +251,280 @@ def get_collection_info():
 
 
 # ── Process CSV ───────────────────────────────────────────────────────────────
-@app.post("/process-csv", response_model=ProcessCSVResponse, tags=["Ingestion"])
-async def process_csv(file: UploadFile = File(...)):
+# In-memory ingest task registry: task_id → status dict (see IngestStatusResponse)
+_ingest_tasks: dict[str, dict] = {}
+# task_id → monotonic finish time for completed/failed tasks, in finish order
+_ingest_finished_at: dict[str, float] = {}
+# upload_id → links already queued by earlier chunks of a chunked upload, so a
+# link repeated across chunks is ingested once (point IDs are random)
+_upload_links: dict[str, set[str]] = {}
+# upload_id → monotonic time its last chunk arrived, oldest first
+_upload_seen_at: dict[str, float] = {}
+
+
+def _finish_ingest_task(task_id: str, **fields) -> None:
+    """Record a task's final status and stamp it for later eviction."""
+    _ingest_tasks[task_id].update(**fields)
+    _ingest_finished_at[task_id] = time.monotonic()
+
+
+def _prune_ingest_tasks() -> None:
+    """
+    Evict finished tasks (with their preview payloads and CSV exports) older
+    than INGEST_TASK_TTL, then the oldest finished ones beyond INGEST_TASK_MAX.
+    Pending/running tasks are never evicted. Chunked uploads idle for
+    INGEST_TASK_TTL drop their seen-link sets too.
+    """
+    cutoff = time.monotonic() - INGEST_TASK_TTL
+    for upload_id, seen_at in list(_upload_seen_at.items()):
+        if seen_at >= cutoff:
+            break
+        del _upload_seen_at[upload_id]
+        _upload_links.pop(upload_id, None)
+
+    excess = len(_ingest_tasks) - INGEST_TASK_MAX
+    for task_id, finished_at in list(_ingest_finished_at.items()):
+        if finished_at >= cutoff and excess <= 0:
+            break
+        del _ingest_finished_at[task_id]
+        task = _ingest_tasks.pop(task_id, None)
+        if task is not None:
+            try:
+                os.remove(task["export_path"])
+            except FileNotFoundError:
+                pass
+        excess -= 1
+
+
+def _upsert_all(nodes: list) -> int:
+    """Upsert nodes, deferring HNSW indexing for large bulk loads."""
+    if len(nodes) > BULK_INDEX_THRESHOLD:
+        with deferred_indexing():
+            return upsert_nodes(nodes)
+    return upsert_nodes(nodes)
+
+
+async def _ingest_links(links: list[str], export_path: str) -> ProcessCSVResponse:
     """
-    Accept a CSV file with at least one column: `yt_link`.
     For each link:
       1. Fetch & clean the YouTube transcript.
       2. Run Llama 3 multi-row extraction → 3–6 EnergyNodes.
       3. Upsert nodes to Qdrant.
-    Returns a preview of extracted rows and a download link for the full CSV.
+    Then export all nodes to `export_path`.
     """
-    if not file.filename.endswith(".csv"):
-        raise HTTPException(status_code=400, detail="Only .csv files are accepted.")
-
-    content = await file.read()
-    try:
-        df = pd.read_csv(io.BytesIO(content))
-    except Exception as exc:
-        raise HTTPException(status_code=422, detail=f"Could not parse CSV: {exc}")
-
-    # Normalize column names
-    df.columns = [c.strip().lower().replace(" ", "_") for c in df.columns]
-    if "yt_link" not in df.columns:
-        # Try common alternatives
-        alt_cols = [c for c in df.columns if "link" in c or "url" in c or "youtube" in c]
-        if not alt_cols:
-            raise HTTPException(
-                status_code=422,
-                detail=f"CSV must contain a 'yt_link' column. Found: {list(df.columns)}",
-            )
-        df = df.rename(columns={alt_cols[0]: "yt_link"})
-
-    links = df["yt_link"].dropna().unique().tolist()
-    logger.info("Processing %d unique YouTube links from CSV", len(links))
-
+    global _extraction_pool_broken
     all_nodes = []
     failed_links: list[str] = []
 
-    for url in links:
-        try:
-            video_id, nodes = process_youtube_url(str(url).strip())
-            logger.info("Extracted %d nodes from %s", len(nodes), url)
-            all_nodes.extend(nodes)
-        except Exception as exc:
-            logger.error("Failed to process %s: %s", url, exc)
-            failed_links.append(str(url))
+    # Fetch + extract all links concurrently (see EXTRACTION_MODE / LLM_BATCH_SIZE),
+    # bounded by a semaphore.
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_LINKS)
+    pool = _get_extraction_pool()
+
+    async def _process_one(url: str):
+        async with semaphore:
+            return await loop.run_in_executor(pool, process_youtube_url, url)
+
+    async def _process_group(group: list[str]):
+        async with semaphore:
+            return await loop.run_in_executor(pool, process_youtube_urls_batch, group)
+
+    if EXTRACTION_MODE == "async":
+        # Native asyncio: transcript fetches + LLM calls overlap on the event loop
+        results = await process_urls(links, max_concurrency=MAX_CONCURRENT_LINKS)
+    elif LLM_BATCH_SIZE > 1:
+        # Batch prompting: LLM_BATCH_SIZE transcripts per LLM call
+        groups = [links[i : i + LLM_BATCH_SIZE] for i in range(0, len(links), LLM_BATCH_SIZE)]
+        group_results = await asyncio.gather(
+            *(_process_group(group) for group in groups),
+            return_exceptions=True,
+        )
+        results = []
+        for group, group_result in zip(groups, group_results):
+            if isinstance(group_result, Exception):
+                results.extend([group_result] * len(group))
+            else:
+                results.extend(group_result)
+    else:
+        results = await asyncio.gather(
+            *(_process_one(url) for url in links),
+            return_exceptions=True,
+        )
+
+    if pool is _extraction_pool and any(isinstance(r, BrokenProcessPool) for r in results):
+        # A worker died mid-ingest; the next ingest replaces the pool
+        _extraction_pool_broken = True
+
+    for url, result in zip(links, results):
+        if isinstance(result, Exception):
+            logger.error("Failed to process %s: %s", url, result)
+            failed_links.append(url)
+            continue
+        video_id, nodes = result
+        logger.info("Extracted %d nodes from %s", len(nodes), url)
+        all_nodes.extend(nodes)
 
     # Upsert to Qdrant
     total_upserted = 0
     if all_nodes:
         try:
-            total_upserted = upsert_nodes(all_nodes)
+            total_upserted = await asyncio.to_thread(_upsert_all, all_nodes)
         except Exception as exc:
             logger.error("Qdrant upsert failed: %s", exc)
-            raise HTTPException(status_code=500, detail=f"Qdrant upsert failed: {exc}")
+            raise RuntimeError(f"Qdrant upsert failed: {exc}") from exc
 
-    # Build flat records for preview & CSV export
-    records = [node.to_payload() for node in all_nodes]
-    if records:
-        export_df = pd.json_normalize(records)
-    else:
-        # Create empty DataFrame with expected columns (including diagnostic_layer)
-        export_df = pd.DataFrame(columns=[
-            "video_id", "video_url", "main_question", "category",
-            # Diagnostic Layer — deciding factor for energy-node routing
-            "diagnostic_layer.related_inner_issues",
-            "diagnostic_layer.reality_commitment_check",
-            "diagnostic_layer.hidden_benefit",
-            "diagnostic_layer.energy_node",
-            # Response pillars — how to talk after knowing the problem
-            "pillars.intervention_narrative", "pillars.intervention_action", "pillars.intervention_shift",
-            "atmosphere.tone", "atmosphere.pacing",
-            "overflow",
-        ])
-
-    # Save to data/ directory
-    os.makedirs("data", exist_ok=True)
-    export_path = "data/extracted_nodes.csv"
-    export_df.to_csv(export_path, index=False)
-    logger.info("Exported extracted nodes to %s (%d rows)", export_path, len(export_df))
+        # Knowledge base changed — cached query results are stale
+        try:
+            await asyncio.to_thread(query_cache.clear)
+        except Exception as exc:
+            logger.warning("Could not clear query cache: %s", exc)
+
+    # Stream flat rows straight to the CSV export (no intermediate DataFrame)
+    os.makedirs(os.path.dirname(export_path), exist_ok=True)
+    preview: list[dict] = []
+    with open(export_path, "w", newline="", encoding="utf-8") as fh:
+        writer = csv.DictWriter(fh, fieldnames=EXPORT_FIELDNAMES)
+        writer.writeheader()
+        for node in all_nodes:
+            payload = node.to_payload()
+            if len(preview) < 10:
+                preview.append(payload)
+            writer.writerow(_flatten(payload))
+    logger.info("Exported extracted nodes to %s (%d rows)", export_path, len(all_nodes))
 
     return ProcessCSVResponse(
         processed_links=len(links) - len(failed_links),
         total_nodes_extracted=len(all_nodes),
         total_nodes_upserted=total_upserted,
         failed_links=failed_links,
-        preview=records[:10],  # Return first 10 rows in the response
+        preview=preview,  # First 10 rows only
     )
 
 
-@app.get("/download-csv", tags=["Ingestion"])
-def download_csv():
-    """Download the last extracted nodes CSV."""
-    path = "data/extracted_nodes.csv"
-    if not os.path.exists(path):
-        raise HTTPException(status_code=404, detail="No extracted CSV found. Run /process-csv first.")
-
+async def _run_ingest(task_id: str, links: list[str]) -> None:
+    """Background task: run the ingest and record its outcome in _ingest_tasks."""
+    _ingest_tasks[task_id]["status"] = "running"
     try:
-        df = pd.read_csv(path)
-    except pd.errors.EmptyDataError:
-        df = pd.DataFrame()
+        result = await _ingest_links(links, _ingest_tasks[task_id]["export_path"])
     except Exception as exc:
-        logger.error("Could not read CSV file: %s", exc)
-        raise HTTPException(status_code=500, detail=f"Internal error reading CSV: {exc}")
+        logger.error("Ingest task %s failed: %s", task_id, exc)
+        _finish_ingest_task(task_id, status="failed", error=str(exc))
+        return
+    _finish_ingest_task(task_id, status="completed", result=result.model_dump())
+
+
+def _read_links(path: str, seen: Optional[set[str]] = None) -> list[str]:
+    """
+    Parse an uploaded CSV and return its unique, non-empty YouTube links in
+    file order, skipping (and then adding to) `seen` when given. Raises
+    HTTPException(422) if the CSV is unreadable or has no link column.
+    """
+    try:
+        with open(path, newline="", encoding="utf-8-sig") as fh:
+            reader = csv.DictReader(fh)
+            fieldnames = reader.fieldnames or []
+
+            # Normalize column names → original header
+            columns = {_COLUMN_WS.sub("_", c.strip().lower()): c for c in fieldnames if c}
+            link_col = columns.get("yt_link")
+            if link_col is None:
+                # Try common alternatives
+                alt_cols = [c for c in columns if "link" in c or "url" in c or "youtube" in c]
+                if not alt_cols:
+                    raise HTTPException(
+                        status_code=422,
+                        detail=f"CSV must contain a 'yt_link' column. Found: {list(columns)}",
+                    )
+                link_col = columns[alt_cols[0]]
+
+            # Unique, non-empty links in file order
+            links: list[str] = []
+            if seen is None:
+                seen = set()
+            for row in reader:
+                url = (row.get(link_col) or "").strip()
+                if url and url not in seen:
+                    seen.add(url)
+                    links.append(url)
+    except (csv.Error, UnicodeDecodeError) as exc:
+        raise HTTPException(status_code=422, detail=f"Could not parse CSV: {exc}")
+    return links
+
+
+@app.post("/process-csv", response_model=IngestTaskResponse, tags=["Ingestion"])
+async def process_csv(
+    background: BackgroundTasks,
+    file: UploadFile = File(...),
+    upload_id: Optional[str] = Form(None),
+):
+    """
+    Accept a CSV file with at least one column: `yt_link`.
+    The CSV is parsed and validated immediately; extraction + upsert run as a
+    background task. Poll GET /ingest-status/{task_id} for progress and results.
+    Chunks of one large upload share an `upload_id` so links are deduplicated
+    across the whole upload, not just within each chunk.
+    """
+    if not (file.filename or "").lower().endswith(".csv"):
+        raise HTTPException(status_code=400, detail="Only .csv files are accepted.")
+
+    # Spool the upload to disk in 1 MB chunks so large CSVs never sit in RAM
+    with tempfile.NamedTemporaryFile("w+b", suffix=".csv", delete=False) as tmp:
+        while chunk := await file.read(1 << 20):
+            tmp.write(chunk)
+        tmp_path = tmp.name
+
+    _prune_ingest_tasks()
+    seen = None
+    if upload_id:
+        seen = _upload_links.setdefault(upload_id, set())
+        _upload_seen_at.pop(upload_id, None)
+        _upload_seen_at[upload_id] = time.monotonic()
+
+    try:
+        links = await asyncio.to_thread(_read_links, tmp_path, seen)
+    finally:
+        os.remove(tmp_path)
+
+    task_id = uuid.uuid4().hex
+    _ingest_tasks[task_id] = {
+        "task_id": task_id,
+        "status": "pending",
+        "total_links": len(links),
+        "export_path": os.path.join(EXPORT_DIR, f"{task_id}.csv"),
+    }
+    background.add_task(_run_ingest, task_id, links)
+    logger.info("Queued %d unique YouTube links from CSV (task %s)", len(links), task_id)
+
+    return IngestTaskResponse(task_id=task_id, status="pending", total_links=len(links))
 
-    stream = io.StringIO()
-    df.to_csv(stream, index=False)
-    stream.seek(0)
 
-    return StreamingResponse(
-        iter([stream.getvalue()]),
+@app.get("/ingest-status/{task_id}", response_model=IngestStatusResponse, tags=["Ingestion"])
+def ingest_status(task_id: str):
+    """Return the status (and, once finished, the result) of an ingest task."""
+    task = _ingest_tasks.get(task_id)
+    if task is None:
+        raise HTTPException(status_code=404, detail=f"Unknown ingest task: {task_id}")
+    return IngestStatusResponse(**task)
+
+
+@app.get("/download-csv", tags=["Ingestion"])
+def download_csv(task_id: str):
+    """Download the extracted nodes CSV of a completed ingest task."""
+    task = _ingest_tasks.get(task_id)
+    if task is None:
+        raise HTTPException(status_code=404, detail=f"Unknown ingest task: {task_id}")
+    path = task["export_path"]
+    if task["status"] != "completed" or not os.path.exists(path):
+        raise HTTPException(
+            status_code=404,
+            detail=f"Ingest task {task_id} has no export (status: {task['status']}).",
+        )
+
+    return FileResponse(
+        path,
         media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=souli_extracted_nodes.csv"},
+        filename="souli_extracted_nodes.csv",
     )
 
 
@@ -226,13 +538,65 @@ def query(request: QueryRequest):
     if not request.query.strip():
         raise HTTPException(status_code=400, detail="Query cannot be empty.")
 
+    results, cache_generation = query_cache.get_exact(
+        request.query, request.k, request.score_threshold
+    )
+    if results is not None:
+        return QueryResponse(results=results, count=len(results))
+
+    try:
+        query_vector = embed_text(request.query)
+    except Exception as exc:
+        raise HTTPException(status_code=503, detail=f"Search failed: {exc}")
+
+    try:
+        results = query_cache.get_similar(
+            request.query, query_vector, request.k, request.score_threshold, cache_generation
+        )
+    except Exception as exc:
+        logger.warning("Query cache lookup failed: %s", exc)
+        results = None
+    if results is not None:
+        return QueryResponse(results=results, count=len(results))
+
     try:
         results = search_nodes(
             query=request.query,
             k=request.k,
             score_threshold=request.score_threshold,
+            query_vector=query_vector,
         )
     except Exception as exc:
         raise HTTPException(status_code=503, detail=f"Search failed: {exc}")
 
+    try:
+        query_cache.put(
+            request.query,
+            query_vector,
+            request.k,
+            request.score_threshold,
+            results,
+            cache_generation,
+        )
+    except Exception as exc:
+        logger.warning("Query cache store failed: %s", exc)
+
     return QueryResponse(results=results, count=len(results))
+
+
+# ── Entrypoint ────────────────────────────────────────────────────────────────
+if __name__ == "__main__":
+    import uvicorn
+
+    # uvloop + httptools come with uvicorn[standard]. Keep a single worker unless
+    # ingest status / query cache move out of process memory — /ingest-status
+    # must hit the worker that owns the task.
+    uvicorn.run(
+        "app.main:app",
+        host=os.getenv("HOST", "0.0.0.0"),
+        port=int(os.getenv("PORT", "8000")),
+        loop="uvloop",
+        http="httptools",
+        backlog=int(os.getenv("UVICORN_BACKLOG", "2048")),
+        workers=int(os.getenv("UVICORN_WORKERS", "1")),
+    )
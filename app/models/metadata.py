@@ -37,7 +37,7 @@ on the right energy block, not just the surface label.)
 """
 
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 
 # ── Tier 0: Diagnostic Layer ──────────────────────────────────────────────────
@@ -54,6 +54,8 @@ class DiagnosticLayer(BaseModel):
     must make its best inference from the coaching transcript context.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     related_inner_issues: str = Field(
         ...,
         description=(
@@ -122,6 +124,8 @@ class Pillars(BaseModel):
     been identified. They shape the tone, metaphor, and practice recommendation.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     intervention_narrative: str = Field(
         ...,
         description=(
@@ -155,6 +159,8 @@ class Pillars(BaseModel):
 class Atmosphere(BaseModel):
     """The emotional atmosphere and pacing the coach creates during delivery."""
 
+    model_config = ConfigDict(frozen=True)
+
     tone: str = Field(
         ...,
         description=(
@@ -174,6 +180,24 @@ class Atmosphere(BaseModel):
     )
 
 
+# ── LLM Output Shape ──────────────────────────────────────────────────────────
+class EnergyNodeRaw(BaseModel):
+    """
+    One node exactly as the extractor LLM returns it — EnergyNode without the
+    video_id / video_url provenance, which the pipeline injects afterwards.
+    Lets a whole response be validated in one TypeAdapter call.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    main_question: str
+    category: str
+    diagnostic_layer: DiagnosticLayer
+    pillars: Pillars
+    atmosphere: Atmosphere
+    overflow: List[str] = Field(default_factory=list)
+
+
 # ── Top-Level: EnergyNode ──────────────────────────────────────────────────────
 class EnergyNode(BaseModel):
     """
@@ -186,6 +210,12 @@ class EnergyNode(BaseModel):
     lands on the correct energy block, not just the surface topic.
     """
 
+    # Frozen so the cached embed text / payload below can never go stale.
+    model_config = ConfigDict(frozen=True)
+
+    _embed_text: Optional[str] = PrivateAttr(default=None)
+    _payload: Optional[dict] = PrivateAttr(default=None)
+
     video_id: str = Field(..., description="YouTube video ID (extracted from URL).")
     video_url: str = Field(..., description="Full YouTube video URL.")
     main_question: str = Field(
@@ -249,16 +279,49 @@ class EnergyNode(BaseModel):
         deciding factor, ensuring the vector space captures both the surface
         struggle and the deep psychological root (energy block) together.
         """
-        dl = self.diagnostic_layer
-        return (
-            f"{self.main_question} "
-            f"{self.category} "
-            f"{dl.related_inner_issues} "
-            f"{dl.reality_commitment_check} "
-            f"{dl.hidden_benefit} "
-            f"{dl.energy_node}"
-        )
+        if self._embed_text is None:
+            dl = self.diagnostic_layer
+            self._embed_text = (
+                f"{self.main_question} "
+                f"{self.category} "
+                f"{dl.related_inner_issues} "
+                f"{dl.reality_commitment_check} "
+                f"{dl.hidden_benefit} "
+                f"{dl.energy_node}"
+            )
+        return self._embed_text
 
     def to_payload(self) -> dict:
-        """Returns the full JSON payload to be stored in Qdrant."""
-        return self.model_dump()
+        """
+        Returns the full JSON payload to be stored in Qdrant.
+
+        The dict is computed once and cached on the instance — treat it as
+        read-only.
+        """
+        if self._payload is None:
+            # Hand-written rather than model_dump(): no schema walk, and the
+            # stored payload shape is pinned here explicitly.
+            dl, p, a = self.diagnostic_layer, self.pillars, self.atmosphere
+            self._payload = {
+                "video_id": self.video_id,
+                "video_url": self.video_url,
+                "main_question": self.main_question,
+                "category": self.category,
+                "diagnostic_layer": {
+                    "related_inner_issues": dl.related_inner_issues,
+                    "reality_commitment_check": dl.reality_commitment_check,
+                    "hidden_benefit": dl.hidden_benefit,
+                    "energy_node": dl.energy_node,
+                },
+                "pillars": {
+                    "intervention_narrative": p.intervention_narrative,
+                    "intervention_action": p.intervention_action,
+                    "intervention_shift": p.intervention_shift,
+                },
+                "atmosphere": {
+                    "tone": a.tone,
+                    "pacing": a.pacing,
+                },
+                "overflow": list(self.overflow),
+            }
+        return self._payload
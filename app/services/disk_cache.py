@@ -0,0 +1,38 @@
+"""
+disk_cache.py — Lazily opened diskcache stores shared by the persistent caches
+(embed_cache, extract_cache).
+
+diskcache is optional: if it is missing or the directory cannot be opened,
+the store logs once and reports itself unavailable, and callers fall back to
+not caching.
+"""
+
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class LazyDiskCache:
+    """A diskcache.Cache at `directory`, opened on first use."""
+
+    def __init__(self, directory: str, label: str):
+        self.directory = directory
+        self.label = label
+        self._disk = None
+        self._unavailable = False
+        self._lock = threading.Lock()
+
+    def open(self):
+        """Return the diskcache store, or None if diskcache is unavailable."""
+        if self._disk is None and not self._unavailable:
+            with self._lock:
+                if self._disk is None and not self._unavailable:
+                    try:
+                        import diskcache  # type: ignore
+                        self._disk = diskcache.Cache(self.directory)
+                        logger.info("Opened %s at %s", self.label, self.directory)
+                    except Exception as exc:
+                        self._unavailable = True
+                        logger.warning("%s disabled: %s", self.label.capitalize(), exc)
+        return self._disk
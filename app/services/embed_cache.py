@@ -0,0 +1,77 @@
+"""
+embed_cache.py — Two-tier cache for text embeddings.
+
+  1. Memory tier: thread-safe LRU of the most recent EMBED_CACHE_MEMORY_SIZE vectors.
+  2. Disk tier:   diskcache store at EMBED_CACHE_DIR, persisted across restarts so
+                  retries and re-runs over partially-ingested CSVs skip the embedder.
+
+Keys are blake2b(model, text) digests — the disk tier outlives restarts, so a
+new embedding model must never be served the old model's vectors. Disk values
+are float32 vector bytes.
+The disk tier is skipped (memory only) if diskcache is not installed.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+from dotenv import load_dotenv
+
+from app.services.disk_cache import LazyDiskCache
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# ── Config ─────────────────────────────────────────────────────────────────────
+EMBED_CACHE_DIR = os.getenv("EMBED_CACHE_DIR", "/tmp/souli_embed")
+EMBED_CACHE_MEMORY_SIZE = int(os.getenv("EMBED_CACHE_MEMORY_SIZE", "10000"))
+
+_lru: "OrderedDict[str, list[float]]" = OrderedDict()
+_lock = threading.Lock()
+_disk = LazyDiskCache(EMBED_CACHE_DIR, "embedding disk cache")
+
+
+def _key(model: str, text: str) -> str:
+    return hashlib.blake2b(f"{model}\x00{text}".encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _lru_put(key: str, vector: list[float]) -> None:
+    with _lock:
+        _lru[key] = vector
+        _lru.move_to_end(key)
+        while len(_lru) > EMBED_CACHE_MEMORY_SIZE:
+            _lru.popitem(last=False)
+
+
+def get(text: str, model: str) -> Optional[list[float]]:
+    """Return the cached `model` vector for `text`, or None."""
+    key = _key(model, text)
+    with _lock:
+        vector = _lru.get(key)
+        if vector is not None:
+            _lru.move_to_end(key)
+            return vector
+
+    disk = _disk.open()
+    if disk is None:
+        return None
+    raw = disk.get(key)
+    if raw is None:
+        return None
+    vector = np.frombuffer(raw, dtype=np.float32).tolist()
+    _lru_put(key, vector)
+    return vector
+
+
+def put(text: str, model: str, vector: list[float]) -> None:
+    """Store the `model` vector for `text` in both tiers."""
+    key = _key(model, text)
+    _lru_put(key, vector)
+    disk = _disk.open()
+    if disk is not None:
+        disk.set(key, np.asarray(vector, dtype=np.float32).tobytes())
@@ -0,0 +1,63 @@
+"""
+extract_cache.py — Persistent cache of raw LLM extraction results.
+
+The LLM call is the dominant per-video cost (10–60s), so reruns over the same
+transcripts reuse the parsed JSON array instead of prompting again.
+
+Keys are sha1(prompt version, model name, truncated transcript) — bumping
+SYSTEM_PROMPT_VERSION or switching OLLAMA_MODEL invalidates old entries.
+Values are the raw node dicts (pre-validation) stored as orjson bytes; the
+extractor only stores responses that yielded at least one valid node.
+Caching is skipped entirely if diskcache is not installed or
+EXTRACT_CACHE_ENABLED=false (e.g. to exercise the LLM on every run).
+"""
+
+import hashlib
+import logging
+import os
+from typing import Optional
+
+import orjson
+from dotenv import load_dotenv
+
+from app.services.disk_cache import LazyDiskCache
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# ── Config ─────────────────────────────────────────────────────────────────────
+EXTRACT_CACHE_ENABLED = os.getenv("EXTRACT_CACHE_ENABLED", "true").lower() == "true"
+# Relative to the working directory, alongside data/exports/
+EXTRACT_CACHE_DIR = os.getenv("EXTRACT_CACHE_DIR", "data/extract_cache")
+
+_disk = LazyDiskCache(EXTRACT_CACHE_DIR, "extraction cache")
+
+
+def _get_disk():
+    """The extraction store, or None when caching is disabled or unavailable."""
+    return _disk.open() if EXTRACT_CACHE_ENABLED else None
+
+
+def make_key(transcript: str, model_name: str, prompt_version: str) -> str:
+    """Cache key for one (transcript, model, prompt version) extraction."""
+    raw = f"{prompt_version}\x00{model_name}\x00{transcript}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def get(key: str) -> Optional[list[dict]]:
+    """Return the cached raw node list for `key`, or None."""
+    disk = _get_disk()
+    if disk is None:
+        return None
+    raw = disk.get(key)
+    if raw is None:
+        return None
+    return orjson.loads(raw)
+
+
+def put(key: str, value: list[dict]) -> None:
+    """Store the raw node list for `key`."""
+    disk = _get_disk()
+    if disk is not None:
+        disk.set(key, orjson.dumps(value))
@@ -13,24 +13,38 @@ deciding factor for energy-node routing, alongside the existing
 Pillars, Atmosphere, and Overflow response fields.
 """
 
+import asyncio
 import json
 import logging
 import os
 import re
-from typing import List
+from functools import lru_cache
+from typing import List, Optional
 
+import httpx
+import orjson
 from dotenv import load_dotenv
+from pydantic import TypeAdapter, ValidationError
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
-from app.models.metadata import EnergyNode, Pillars, Atmosphere, DiagnosticLayer
+from app.models.metadata import EnergyNode, EnergyNodeRaw, Pillars, Atmosphere, DiagnosticLayer
+from app.services import extract_cache
 from app.services.text_utils import fetch_transcript, clean_transcript, truncate_transcript
 
 load_dotenv(override=True)
 
 logger = logging.getLogger(__name__)
 
+# Resolved once at import; set DEV_RELOAD_ENV=1 to re-read .env on each LLM call
+_LLM_TYPE = os.getenv("LLM_TYPE", "ollama").lower()
+# How long Ollama keeps the model (and the SYSTEM_PROMPT prefix KV cache) resident
+OLLAMA_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
+
 
 # ── System Prompt ─────────────────────────────────────────────────────────────
+# Bump whenever SYSTEM_PROMPT / USER_PROMPT_TEMPLATE change; part of the extract cache key
+SYSTEM_PROMPT_VERSION = "3.0"
+
 SYSTEM_PROMPT = """\
 You are an expert coaching analyst for Souli — an AI-powered emotional wellness
 companion that supports users through daily emotional challenges using safe
@@ -118,18 +132,33 @@ TRANSCRIPT:
 Return the JSON array now:
 """
 
+# Batch prompting: K transcripts share one system-prompt prefill
+BATCH_USER_PROMPT_TEMPLATE = """\
+You are given {count} numbered transcripts. Analyze EACH transcript independently
+and produce 3 to 6 objects for it using the schema above.
 
-# ── LLM Factory ───────────────────────────────────────────────────────────────
-def get_llm():
-    """Return the configured LangChain chat model."""
-    load_dotenv(override=True)
-    logger.info("DEBUG: Extractor logic version 3.0 (DiagnosticLayer schema)")
+Return ONLY a JSON array with exactly one entry per transcript, in order:
+[{{"id": 1, "nodes": [<objects for transcript 1>]}}, {{"id": 2, "nodes": [<objects for transcript 2>]}}]
 
-    llm_type = os.getenv("LLM_TYPE", "ollama").lower()
+{transcripts}
 
-    # When running in Docker Compose, 'ollama' is the hostname of the service
-    ollama_base_url = os.getenv("OLLAMA_BASE_URL", "http://ollama:11434") 
-    ollama_model = os.getenv("OLLAMA_MODEL", "llama3.1:8b")
+Return the JSON array now:
+"""
+
+BATCH_TRANSCRIPT_TEMPLATE = """\
+## TRANSCRIPT {id}:
+{transcript}
+"""
+
+
+# ── LLM Factory ───────────────────────────────────────────────────────────────
+@lru_cache(maxsize=4)
+def _build_llm(llm_type: str, ollama_base_url: str, ollama_model: str):
+    """
+    Construct the LangChain chat model. Memoized so retries and later calls
+    reuse one client (and its keep-alive connections) per configuration.
+    """
+    logger.info("DEBUG: Extractor logic version 3.0 (DiagnosticLayer schema)")
 
     if llm_type == "ollama":
         from langchain_ollama import ChatOllama
@@ -137,46 +166,228 @@ def get_llm():
             base_url=ollama_base_url, 
             model=ollama_model, 
             temperature=0.3,
+            keep_alive=OLLAMA_KEEP_ALIVE,
             timeout=60 # Give the 8B model time to process long transcripts
         )
 
 
+def get_llm():
+    """Return the configured LangChain chat model."""
+    global _LLM_TYPE
+    if os.getenv("DEV_RELOAD_ENV"):
+        load_dotenv(override=True)
+        _LLM_TYPE = os.getenv("LLM_TYPE", "ollama").lower()
+
+    # When running in Docker Compose, 'ollama' is the hostname of the service
+    ollama_base_url = os.getenv("OLLAMA_BASE_URL", "http://ollama:11434") 
+    ollama_model = os.getenv("OLLAMA_MODEL", "llama3.1:8b")
+
+    return _build_llm(_LLM_TYPE, ollama_base_url, ollama_model)
+
+
 
 # ── JSON extraction helper ────────────────────────────────────────────────────
+_FENCE = re.compile(r"```(?:json)?")
+_ARRAY = re.compile(r"\[.*\]", re.DOTALL)
+
+
+def _find_json_array(text: str, start: int = 0) -> Optional[str]:
+    """
+    Return the balanced [...] span opening at the first "[" at or after
+    `start`, or None. Single pass tracking bracket depth; brackets inside
+    JSON string literals (and escaped quotes) are ignored.
+    """
+    begin = text.find("[", start)
+    if begin == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escape = False
+    for i in range(begin, len(text)):
+        ch = text[i]
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "[":
+            depth += 1
+        elif ch == "]":
+            depth -= 1
+            if depth == 0:
+                return text[begin : i + 1]
+    return None
+
+
 def _extract_json_array(text: str) -> list:
     """
     Extract the first JSON array from a string.
     Handles cases where the LLM wraps the array in prose or markdown fences.
     """
     # Strip markdown fences
-    text = re.sub(r"```(?:json)?", "", text).strip()
+    text = _FENCE.sub("", text).strip()
 
-    # Try direct parse first
-    try:
-        parsed = json.loads(text)
-        if isinstance(parsed, list):
-            return parsed
-    except json.JSONDecodeError:
-        pass
+    # Try direct parse first — only when the response starts like an array,
+    # so prose-prefixed responses skip a guaranteed decode failure
+    if text.startswith("["):
+        try:
+            parsed = orjson.loads(text)
+            if isinstance(parsed, list):
+                return parsed
+        except orjson.JSONDecodeError:
+            pass
+
+    # Scan for the first balanced [...] block that parses as a JSON array of
+    # objects. A block that fails to parse is skipped whole, and an unbalanced
+    # "[" (e.g. "[see below") moves on to the next one. Only arrays of objects
+    # qualify, so nested lists of strings (e.g. "overflow") of a malformed or
+    # truncated response are never returned — it raises and gets retried.
+    pos = text.find("[")
+    while pos != -1:
+        candidate = _find_json_array(text, pos)
+        if candidate is None:
+            pos = text.find("[", pos + 1)
+            continue
+        try:
+            parsed = orjson.loads(candidate)
+            if isinstance(parsed, list) and all(isinstance(item, dict) for item in parsed):
+                return parsed
+        except orjson.JSONDecodeError:
+            pass
+        pos = text.find("[", pos + len(candidate))
 
-    # Find outermost [...] block via regex
-    match = re.search(r"\[.*\]", text, re.DOTALL)
+    # Last resort: outermost [...] block via regex
+    match = _ARRAY.search(text)
     if match:
         try:
-            parsed = json.loads(match.group(0))
+            parsed = orjson.loads(match.group(0))
             if isinstance(parsed, list):
                 return parsed
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             pass
 
     raise ValueError("No valid JSON array found in LLM response.")
 
 
 # ── Core Extraction ───────────────────────────────────────────────────────────
+def _build_messages(user_prompt: str) -> list:
+    """SYSTEM_PROMPT + `user_prompt` as LangChain messages, logging the target model."""
+    from langchain_core.messages import HumanMessage, SystemMessage  # type: ignore
+
+    llm_type = _LLM_TYPE
+    model_name = os.getenv("GROQ_MODEL" if llm_type == "groq" else "OLLAMA_MODEL", "unknown")
+    logger.info("Calling LLM (%s/%s) ...", llm_type, model_name)
+
+    return [
+        SystemMessage(content=SYSTEM_PROMPT),
+        HumanMessage(content=user_prompt),
+    ]
+
+
+def _response_text(response) -> str:
+    raw = response.content if hasattr(response, "content") else str(response)
+    logger.debug("Raw LLM response (first 800 chars): %s", raw[:800])
+    return raw
+
+
+# ── Direct Ollama HTTP path ───────────────────────────────────────────────────
+# For the default ollama backend we POST to /api/chat ourselves — no LangChain
+# message objects, callbacks, or wrapper validation per call. Set
+# LLM_USE_LANGCHAIN=true to go through ChatOllama instead.
+_http_client: Optional[httpx.Client] = None
+_async_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _use_direct_ollama() -> bool:
+    return (
+        _LLM_TYPE == "ollama"
+        and os.getenv("LLM_USE_LANGCHAIN", "false").lower() != "true"
+    )
+
+
+def _ollama_request(user_prompt: str) -> tuple[str, dict]:
+    """(url, json payload) for an Ollama /api/chat call."""
+    base_url = os.getenv("OLLAMA_BASE_URL", "http://ollama:11434").rstrip("/")
+    model = os.getenv("OLLAMA_MODEL", "llama3.1:8b")
+    logger.info("Calling LLM (ollama/%s) ...", model)
+    payload = {
+        "model": model,
+        "messages": [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt},
+        ],
+        "options": {"temperature": 0.3},
+        "keep_alive": OLLAMA_KEEP_ALIVE,
+        "stream": False,
+    }
+    return f"{base_url}/api/chat", payload
+
+
+def _ollama_text(data: dict) -> str:
+    raw = data.get("message", {}).get("content", "")
+    logger.debug("Raw LLM response (first 800 chars): %s", raw[:800])
+    return raw
+
+
+def _invoke_llm(user_prompt: str) -> str:
+    """Send SYSTEM_PROMPT + `user_prompt` to the LLM and return the raw text."""
+    global _http_client
+    if _use_direct_ollama():
+        if _http_client is None:
+            _http_client = httpx.Client(timeout=60)  # 8B model needs time on long transcripts
+        url, payload = _ollama_request(user_prompt)
+        response = _http_client.post(url, json=payload)
+        response.raise_for_status()
+        return _ollama_text(response.json())
+
+    llm = get_llm()
+    return _response_text(llm.invoke(_build_messages(user_prompt)))
+
+
+async def _ainvoke_llm(user_prompt: str) -> str:
+    """Async variant of _invoke_llm (uses the model's native ainvoke)."""
+    global _async_http_client
+    if _use_direct_ollama():
+        if _async_http_client is None:
+            _async_http_client = httpx.AsyncClient(timeout=60)
+        url, payload = _ollama_request(user_prompt)
+        response = await _async_http_client.post(url, json=payload)
+        response.raise_for_status()
+        return _ollama_text(response.json())
+
+    llm = get_llm()
+    return _response_text(await llm.ainvoke(_build_messages(user_prompt)))
+
+
+def warm_up_llm() -> None:
+    """
+    Send SYSTEM_PROMPT once (with a one-token reply) so Ollama loads the model
+    and caches the shared prompt prefix before the first real extraction.
+    Best-effort: failures are logged, never raised.
+    """
+    if _LLM_TYPE != "ollama":
+        return
+    try:
+        if _use_direct_ollama():
+            url, payload = _ollama_request("OK")
+            payload["options"]["num_predict"] = 1
+            httpx.post(url, json=payload, timeout=120).raise_for_status()
+        else:
+            get_llm().invoke(_build_messages("OK"))
+        logger.info("LLM warm-up complete (keep_alive=%s)", OLLAMA_KEEP_ALIVE)
+    except Exception as exc:
+        logger.warning("LLM warm-up failed: %s", exc)
+
+
 @retry(
     stop=stop_after_attempt(3),
     wait=wait_exponential(multiplier=1, min=2, max=10),
-    retry=retry_if_exception_type((ValueError, json.JSONDecodeError)),
+    retry=retry_if_exception_type((ValueError, json.JSONDecodeError, orjson.JSONDecodeError)),
     reraise=True,
 )
 def _call_llm_and_parse(transcript: str) -> list[dict]:
@@ -184,40 +395,112 @@ def _call_llm_and_parse(transcript: str) -> list[dict]:
     Call the LLM and parse the JSON array response.
     Retried up to 3 times on parse failures.
     """
-    from langchain_core.messages import HumanMessage, SystemMessage  # type: ignore
+    raw = _invoke_llm(USER_PROMPT_TEMPLATE.format(transcript=transcript))
+    return _extract_json_array(raw)
 
-    llm = get_llm()
-    messages = [
-        SystemMessage(content=SYSTEM_PROMPT),
-        HumanMessage(content=USER_PROMPT_TEMPLATE.format(transcript=transcript)),
-    ]
 
-    llm_type = os.getenv("LLM_TYPE", "ollama").lower()
-    model_name = os.getenv("GROQ_MODEL" if llm_type == "groq" else "OLLAMA_MODEL", "unknown")
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=2, max=10),
+    retry=retry_if_exception_type((ValueError, json.JSONDecodeError, orjson.JSONDecodeError)),
+    reraise=True,
+)
+async def _call_llm_and_parse_async(transcript: str) -> list[dict]:
+    """Async variant of _call_llm_and_parse (tenacity retries coroutines natively)."""
+    raw = await _ainvoke_llm(USER_PROMPT_TEMPLATE.format(transcript=transcript))
+    return _extract_json_array(raw)
 
-    logger.info("Calling LLM (%s/%s) ...", llm_type, model_name)
-    response = llm.invoke(messages)
-    raw = response.content if hasattr(response, "content") else str(response)
-    logger.debug("Raw LLM response (first 800 chars): %s", raw[:800])
 
-    return _extract_json_array(raw)
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=2, max=10),
+    retry=retry_if_exception_type((ValueError, json.JSONDecodeError, orjson.JSONDecodeError)),
+    reraise=True,
+)
+def _call_llm_and_parse_batch(transcripts: list[str]) -> dict[int, list]:
+    """
+    Call the LLM once for several numbered transcripts.
+
+    Returns:
+        {transcript_index (0-based): raw node dicts} for every entry the
+        model returned; missing indices are left for the caller to retry.
+    """
+    numbered = "\n".join(
+        BATCH_TRANSCRIPT_TEMPLATE.format(id=i + 1, transcript=t)
+        for i, t in enumerate(transcripts)
+    )
+    raw = _invoke_llm(
+        BATCH_USER_PROMPT_TEMPLATE.format(count=len(transcripts), transcripts=numbered)
+    )
+
+    by_index: dict[int, list] = {}
+    for entry in _extract_json_array(raw):
+        if not isinstance(entry, dict) or not isinstance(entry.get("nodes"), list):
+            continue
+        try:
+            idx = int(entry.get("id")) - 1
+        except (TypeError, ValueError):
+            continue
+        if 0 <= idx < len(transcripts):
+            by_index[idx] = entry["nodes"]
+
+    if not by_index:
+        raise ValueError("Batch LLM response contained no per-transcript entries.")
+    return by_index
+
+
+# Schema built once at import; validates a whole LLM response in one pydantic-core call
+_RAW_NODES_ADAPTER = TypeAdapter(List[EnergyNodeRaw])
+
+
+def _construct_trusted(model_cls, raw: dict, default=None):
+    """
+    Build a flat all-string sub-model (DiagnosticLayer / Pillars / Atmosphere).
+    When every field is already a str — the normal case for parsed LLM JSON —
+    skip per-field validation with model_construct; otherwise fall back to the
+    validating constructor so bad rows still raise.
+    """
+    values = {name: raw.get(name, default) for name in model_cls.model_fields}
+    if all(isinstance(v, str) for v in values.values()):
+        return model_cls.model_construct(**values)
+    return model_cls.model_validate(values)
 
 
 def _validate_nodes(raw_list: list, video_id: str, video_url: str) -> list[EnergyNode]:
     """
     Validate raw dicts against the EnergyNode schema.
     Invalid items are logged and skipped rather than crashing the pipeline.
+
+    The whole list is validated in one TypeAdapter pass first; if any item
+    fails, the per-item path below recovers the valid ones (and fills missing
+    diagnostic fields with "").
     """
+    try:
+        validated = _RAW_NODES_ADAPTER.validate_python(raw_list)
+    except ValidationError:
+        pass
+    else:
+        # Already validated — attach provenance without a second validation pass
+        return [
+            EnergyNode.model_construct(
+                video_id=video_id,
+                video_url=video_url,
+                main_question=raw.main_question,
+                category=raw.category,
+                diagnostic_layer=raw.diagnostic_layer,
+                pillars=raw.pillars,
+                atmosphere=raw.atmosphere,
+                overflow=raw.overflow,
+            )
+            for raw in validated
+        ]
+
     nodes: list[EnergyNode] = []
     for i, item in enumerate(raw_list):
         try:
             # ── Build DiagnosticLayer ─────────────────────────────────────────
-            dl_raw = item.get("diagnostic_layer", {})
-            diagnostic_layer = DiagnosticLayer(
-                related_inner_issues=dl_raw.get("related_inner_issues", ""),
-                reality_commitment_check=dl_raw.get("reality_commitment_check", ""),
-                hidden_benefit=dl_raw.get("hidden_benefit", ""),
-                energy_node=dl_raw.get("energy_node", ""),
+            diagnostic_layer = _construct_trusted(
+                DiagnosticLayer, item.get("diagnostic_layer", {}), default=""
             )
 
             # ── Build full EnergyNode ─────────────────────────────────────────
@@ -227,8 +510,8 @@ def _validate_nodes(raw_list: list, video_id: str, video_url: str) -> list[Energ
                 main_question=item["main_question"],
                 category=item["category"],
                 diagnostic_layer=diagnostic_layer,
-                pillars=Pillars(**item["pillars"]),
-                atmosphere=Atmosphere(**item["atmosphere"]),
+                pillars=_construct_trusted(Pillars, item["pillars"]),
+                atmosphere=_construct_trusted(Atmosphere, item["atmosphere"]),
                 overflow=item.get("overflow", []),
             )
             nodes.append(node)
@@ -238,6 +521,37 @@ def _validate_nodes(raw_list: list, video_id: str, video_url: str) -> list[Energ
     return nodes
 
 
+def _extract_cache_key(truncated: str) -> str:
+    """Extract-cache key for a truncated transcript under the current model + prompt."""
+    if _LLM_TYPE == "ollama":
+        model_name = os.getenv("OLLAMA_MODEL", "llama3.1:8b")
+    else:
+        model_name = os.getenv("GROQ_MODEL", "")
+    return extract_cache.make_key(truncated, f"{_LLM_TYPE}/{model_name}", SYSTEM_PROMPT_VERSION)
+
+
+def _cached_nodes(cache_key: str, video_id: str, video_url: str) -> Optional[list[EnergyNode]]:
+    """Validated nodes from the extract cache, or None on a miss (or an entry with no valid nodes)."""
+    raw_list = extract_cache.get(cache_key)
+    if raw_list is None:
+        return None
+    nodes = _validate_nodes(raw_list, video_id, video_url)
+    if not nodes:
+        return None
+    logger.info("Extract cache hit for video_id=%s — skipping LLM", video_id)
+    return nodes
+
+
+def _validate_and_cache(
+    cache_key: str, raw_list: list, video_id: str, video_url: str
+) -> list[EnergyNode]:
+    """Validate fresh LLM output; cache it only if at least one node survives."""
+    nodes = _validate_nodes(raw_list, video_id, video_url)
+    if nodes:
+        extract_cache.put(cache_key, raw_list)
+    return nodes
+
+
 def extract_energy_nodes(
     transcript: str,
     video_id: str,
@@ -263,17 +577,98 @@ def extract_energy_nodes(
         len(truncated),
     )
 
+    cache_key = _extract_cache_key(truncated)
+    nodes = _cached_nodes(cache_key, video_id, video_url)
+    if nodes is not None:
+        return nodes
+
     try:
         raw_list = _call_llm_and_parse(truncated)
     except Exception as exc:
         logger.error("LLM extraction failed after retries for %s: %s", video_id, exc)
         return []
 
-    nodes = _validate_nodes(raw_list, video_id, video_url)
+    nodes = _validate_and_cache(cache_key, raw_list, video_id, video_url)
     logger.info("Extracted %d valid EnergyNodes for video_id=%s", len(nodes), video_id)
     return nodes
 
 
+async def extract_energy_nodes_async(
+    transcript: str,
+    video_id: str,
+    video_url: str,
+    max_chars: int = 12_000,
+) -> list[EnergyNode]:
+    """Async variant of extract_energy_nodes — awaits the LLM without blocking."""
+    truncated = truncate_transcript(transcript, max_chars=max_chars)
+    cache_key = _extract_cache_key(truncated)
+    nodes = _cached_nodes(cache_key, video_id, video_url)
+    if nodes is not None:
+        return nodes
+
+    try:
+        raw_list = await _call_llm_and_parse_async(truncated)
+    except Exception as exc:
+        logger.error("LLM extraction failed after retries for %s: %s", video_id, exc)
+        return []
+
+    nodes = _validate_and_cache(cache_key, raw_list, video_id, video_url)
+    logger.info("Extracted %d valid EnergyNodes for video_id=%s", len(nodes), video_id)
+    return nodes
+
+
+def extract_energy_nodes_batch(
+    items: list[tuple[str, str, str]],
+    max_chars: int = 12_000,
+) -> list[list[EnergyNode]]:
+    """
+    Extract EnergyNodes for several transcripts with one batched LLM call.
+
+    Args:
+        items:      (transcript, video_id, video_url) tuples.
+        max_chars:  Maximum chars per transcript sent to LLM.
+
+    Returns:
+        One list of validated EnergyNodes per item, in input order. Items in
+        the extract cache skip the LLM; items the batched response did not
+        cover fall back to extract_energy_nodes().
+    """
+    if len(items) == 1:
+        transcript, video_id, video_url = items[0]
+        return [extract_energy_nodes(transcript, video_id, video_url, max_chars=max_chars)]
+
+    truncated = [truncate_transcript(t, max_chars=max_chars) for t, _, _ in items]
+    cache_keys = [_extract_cache_key(t) for t in truncated]
+
+    # Serve cached extractions first; only the misses go into the batched prompt
+    results: list[Optional[list[EnergyNode]]] = [
+        _cached_nodes(key, video_id, video_url)
+        for key, (_, video_id, video_url) in zip(cache_keys, items)
+    ]
+    pending = [i for i, nodes in enumerate(results) if nodes is None]
+
+    by_index: dict[int, list] = {}
+    if len(pending) > 1:
+        try:
+            batch_result = _call_llm_and_parse_batch([truncated[i] for i in pending])
+        except Exception as exc:
+            logger.error("Batched LLM extraction failed after retries: %s", exc)
+            batch_result = {}
+        by_index = {pending[j]: raw_list for j, raw_list in batch_result.items()}
+
+    for i in pending:
+        transcript, video_id, video_url = items[i]
+        if i in by_index:
+            nodes = _validate_and_cache(cache_keys[i], by_index[i], video_id, video_url)
+            logger.info("Extracted %d valid EnergyNodes for video_id=%s (batched)", len(nodes), video_id)
+        else:
+            if len(pending) > 1:
+                logger.warning("Batch response missing video_id=%s — extracting individually", video_id)
+            nodes = extract_energy_nodes(transcript, video_id, video_url, max_chars=max_chars)
+        results[i] = nodes
+    return results
+
+
 # ── End-to-End Pipeline for One URL ──────────────────────────────────────────
 def process_youtube_url(yt_url: str) -> tuple[str, list[EnergyNode]]:
     """
@@ -286,3 +681,57 @@ def process_youtube_url(yt_url: str) -> tuple[str, list[EnergyNode]]:
     cleaned = clean_transcript(raw_transcript)
     nodes = extract_energy_nodes(cleaned, video_id, yt_url)
     return video_id, nodes
+
+
+def process_youtube_urls_batch(yt_urls: list[str]) -> list:
+    """
+    Batched pipeline: URLs → transcripts → clean → one batched extract → validate.
+
+    Returns:
+        One entry per URL, in order: (video_id, list_of_energy_nodes), or the
+        Exception raised while fetching that URL's transcript.
+    """
+    results: list = [None] * len(yt_urls)
+    items: list[tuple[str, str, str]] = []
+    item_positions: list[int] = []
+    for i, yt_url in enumerate(yt_urls):
+        try:
+            video_id, raw_transcript = fetch_transcript(yt_url)
+        except Exception as exc:
+            results[i] = exc
+            continue
+        items.append((clean_transcript(raw_transcript), video_id, yt_url))
+        item_positions.append(i)
+
+    if items:
+        for pos, item, nodes in zip(item_positions, items, extract_energy_nodes_batch(items)):
+            results[pos] = (item[1], nodes)
+    return results
+
+
+async def process_youtube_url_async(yt_url: str) -> tuple[str, list[EnergyNode]]:
+    """
+    Async pipeline for one URL: the blocking transcript fetch runs in a thread,
+    the LLM call is awaited natively, so many URLs overlap on one event loop.
+    """
+    video_id, raw_transcript = await asyncio.to_thread(fetch_transcript, yt_url)
+    cleaned = clean_transcript(raw_transcript)
+    nodes = await extract_energy_nodes_async(cleaned, video_id, yt_url)
+    return video_id, nodes
+
+
+async def process_urls(yt_urls: list[str], max_concurrency: int = 16) -> list:
+    """
+    Run process_youtube_url_async over many URLs concurrently.
+
+    Returns:
+        One entry per URL, in order: (video_id, list_of_energy_nodes) or the
+        Exception raised for that URL.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _one(yt_url: str):
+        async with semaphore:
+            return await process_youtube_url_async(yt_url)
+
+    return await asyncio.gather(*(_one(u) for u in yt_urls), return_exceptions=True)
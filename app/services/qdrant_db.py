@@ -4,19 +4,23 @@ qdrant_db.py — Qdrant collection management, upsert, and similarity search.
 
 import logging
 import os
+import threading
 import uuid
+from contextlib import contextmanager
 from typing import List, Optional
 
 from dotenv import load_dotenv
 from qdrant_client import QdrantClient
 from qdrant_client.models import (
     Distance,
+    HnswConfigDiff,
     VectorParams,
     PointStruct,
     ScoredPoint,
 )
 
 from app.models.metadata import EnergyNode
+from app.services import embed_cache
 
 load_dotenv()
 
@@ -26,14 +30,35 @@ logger = logging.getLogger(__name__)
 QDRANT_HOST = os.getenv("QDRANT_HOST", "localhost")
 QDRANT_PORT = int(os.getenv("QDRANT_PORT", "6333"))
 QDRANT_COLLECTION = os.getenv("QDRANT_COLLECTION", "souli_knowledge_base")
+QDRANT_GRPC_PORT = int(os.getenv("QDRANT_GRPC_PORT", "6334"))
+# gRPC (HTTP/2) for upsert/search; set QDRANT_PREFER_GRPC=false to force REST
+QDRANT_PREFER_GRPC = os.getenv("QDRANT_PREFER_GRPC", "true").lower() == "true"
+QDRANT_TIMEOUT = int(os.getenv("QDRANT_TIMEOUT", "30"))
 
 # Embedding dimension for fastembed "BAAI/bge-small-en-v1.5" = 384
+# (FastEmbed already serves this model as a quantized ONNX export.)
 VECTOR_SIZE = 384
 EMBED_MODEL = "BAAI/bge-small-en-v1.5"
+# ONNX Runtime intra-op threads for the embedder
+EMBED_THREADS = int(os.getenv("EMBED_THREADS", str(os.cpu_count() or 1)))
+
+# Bulk upserts larger than this pause HNSW graph building until the load finishes
+BULK_INDEX_THRESHOLD = int(os.getenv("QDRANT_BULK_INDEX_THRESHOLD", "5000"))
+# HNSW `m` restored after a bulk load if the collection reports m=0 (Qdrant default)
+HNSW_M = int(os.getenv("QDRANT_HNSW_M", "16"))
+# Parallel upload workers for upload_points
+UPSERT_WORKERS = int(os.getenv("QDRANT_UPSERT_WORKERS", "4"))
+# ...but only once each worker would get at least this many batches to upload
+PARALLEL_UPSERT_MIN_BATCHES = int(os.getenv("QDRANT_PARALLEL_UPSERT_MIN_BATCHES", "4"))
 
 # ── Singleton client ──────────────────────────────────────────────────────────
 _client: Optional[QdrantClient] = None
 _embedder = None
+_embedder_lock = threading.Lock()
+# deferred_indexing bookkeeping: active bulk loads and the `m` to restore, per collection
+_deferred_lock = threading.Lock()
+_deferred_refs: dict[str, int] = {}
+_deferred_original_m: dict[str, int] = {}
 
 
 def get_client() -> QdrantClient:
@@ -43,32 +68,79 @@ def get_client() -> QdrantClient:
         _client = QdrantClient(
             host="qdrant", 
             port=6333,
+            grpc_port=QDRANT_GRPC_PORT,
+            prefer_grpc=QDRANT_PREFER_GRPC,
+            timeout=QDRANT_TIMEOUT,
             https=False,
             api_key=os.getenv("QDRANT_API_KEY") # Added for security
         )
-        logger.info("Connected to secure Qdrant instance")
+        logger.info(
+            "Connected to secure Qdrant instance (%s)", "gRPC" if QDRANT_PREFER_GRPC else "REST"
+        )
     return _client
 
 def get_embedder():
-    """Lazy-load the FastEmbed embedder (downloads model on first use)."""
+    """
+    Lazy-load the FastEmbed embedder (downloads model on first use).
+    Warmed at API startup; the lock keeps concurrent first callers from
+    loading the model twice.
+    """
     global _embedder
     if _embedder is None:
-        try:
-            from fastembed import TextEmbedding  # type: ignore
-            _embedder = TextEmbedding(model_name=EMBED_MODEL)
-            logger.info("Loaded FastEmbed model: %s", EMBED_MODEL)
-        except ImportError:
-            raise ImportError(
-                "fastembed is required. Install it with: pip install fastembed"
-            )
+        with _embedder_lock:
+            if _embedder is None:
+                try:
+                    from fastembed import TextEmbedding  # type: ignore
+                    _embedder = TextEmbedding(
+                        model_name=EMBED_MODEL,
+                        providers=["CPUExecutionProvider"],
+                        threads=EMBED_THREADS,
+                    )
+                    logger.info("Loaded FastEmbed model: %s (%d threads)", EMBED_MODEL, EMBED_THREADS)
+                except ImportError:
+                    raise ImportError(
+                        "fastembed is required. Install it with: pip install fastembed"
+                    )
     return _embedder
 
 
 def embed_text(text: str) -> list[float]:
-    """Embed a single string and return the vector as a list of floats."""
+    """
+    Embed a single string and return the vector as a list of floats.
+    Results are cached (memory + disk) so identical text is embedded once.
+    """
+    cached = embed_cache.get(text, EMBED_MODEL)
+    if cached is not None:
+        return cached
+
     embedder = get_embedder()
-    vectors = list(embedder.embed([text]))  # returns generator
-    return [float(v) for v in vectors[0]]
+    vector = next(iter(embedder.embed([text]))).tolist()  # embed() returns a generator
+    embed_cache.put(text, EMBED_MODEL, vector)
+    return vector
+
+
+def embed_texts(texts: list[str], batch_size: int = 64) -> list[list[float]]:
+    """
+    Embed many strings with one batched FastEmbed call.
+    Cached vectors are reused; only unique cache misses go through the model.
+    """
+    vectors: list[Optional[list[float]]] = [embed_cache.get(t, EMBED_MODEL) for t in texts]
+
+    # Unique uncached strings → positions needing them (identical texts embed once)
+    missing: dict[str, list[int]] = {}
+    for i, v in enumerate(vectors):
+        if v is None:
+            missing.setdefault(texts[i], []).append(i)
+
+    if missing:
+        embedder = get_embedder()
+        embedded = embedder.embed(list(missing), batch_size=batch_size)
+        for (text, positions), vec in zip(missing.items(), embedded):
+            vector = vec.tolist()
+            embed_cache.put(text, EMBED_MODEL, vector)
+            for i in positions:
+                vectors[i] = vector
+    return vectors
 
 
 # ── Collection Management ─────────────────────────────────────────────────────
@@ -90,11 +162,61 @@ def ensure_collection(
         logger.debug("Qdrant collection '%s' already exists.", collection_name)
 
 
+@contextmanager
+def deferred_indexing(collection_name: str = QDRANT_COLLECTION):
+    """
+    Disable HNSW graph building (m=0) for the duration of a bulk load and
+    restore the collection's original `m` afterwards, so Qdrant builds the
+    index once instead of contending with the upsert.
+
+    Reference-counted per collection: overlapping bulk loads share one m=0
+    window, and only the last one out restores `m` (the value read by the
+    first one in — never the 0 a later loader would read back).
+    """
+    client = get_client()
+    with _deferred_lock:
+        if _deferred_refs.get(collection_name, 0) == 0:
+            ensure_collection(client, collection_name)
+            original_m = client.get_collection(collection_name).config.hnsw_config.m
+            # A previous crash mid-load can leave m=0 behind; restore the default then
+            _deferred_original_m[collection_name] = original_m or HNSW_M
+            client.update_collection(collection_name, hnsw_config=HnswConfigDiff(m=0))
+            logger.info("Deferred HNSW indexing on '%s' for bulk load", collection_name)
+        _deferred_refs[collection_name] = _deferred_refs.get(collection_name, 0) + 1
+    try:
+        yield
+    finally:
+        with _deferred_lock:
+            _deferred_refs[collection_name] -= 1
+            if _deferred_refs[collection_name] == 0:
+                del _deferred_refs[collection_name]
+                original_m = _deferred_original_m.pop(collection_name)
+                client.update_collection(collection_name, hnsw_config=HnswConfigDiff(m=original_m))
+                logger.info("Restored HNSW indexing on '%s' (m=%d)", collection_name, original_m)
+
+
 # ── Upsert ────────────────────────────────────────────────────────────────────
+def _iter_points(nodes: list[EnergyNode], batch_size: int):
+    """
+    Lazily embed nodes `batch_size` at a time and yield PointStructs, so the
+    uploader can send batch N while batch N+1 is still being embedded.
+    """
+    for i in range(0, len(nodes), batch_size):
+        chunk = nodes[i : i + batch_size]
+        vectors = embed_texts([node.embed_text() for node in chunk])
+        for node, vector in zip(chunk, vectors):
+            yield PointStruct(
+                id=str(uuid.uuid4()),
+                vector=vector,
+                payload=node.to_payload(),
+            )
+
+
 def upsert_nodes(
     nodes: list[EnergyNode],
     collection_name: str = QDRANT_COLLECTION,
     batch_size: int = 64,
+    parallel: int = UPSERT_WORKERS,
 ) -> int:
     """
     Embed and upsert a list of EnergyNodes into Qdrant.
@@ -102,6 +224,11 @@ def upsert_nodes(
     Vectorized field: node.embed_text() = "main_question category"
     Stored payload:   node.to_payload() = full Tiered JSON object
 
+    Points stream through client.upload_points, which retries failed batches.
+    Parallel upload workers (separate processes, each with its own client)
+    are only started when every worker gets PARALLEL_UPSERT_MIN_BATCHES
+    batches; smaller upserts go out on the existing connection.
+
     Returns:
         Number of successfully upserted points.
     """
@@ -111,27 +238,20 @@ def upsert_nodes(
     client = get_client()
     ensure_collection(client, collection_name)
 
-    points: list[PointStruct] = []
-    for node in nodes:
-        vector = embed_text(node.embed_text())
-        payload = node.to_payload()
-        points.append(
-            PointStruct(
-                id=str(uuid.uuid4()),
-                vector=vector,
-                payload=payload,
-            )
-        )
-
-    # Batch upsert
-    total_upserted = 0
-    for i in range(0, len(points), batch_size):
-        batch = points[i : i + batch_size]
-        client.upsert(collection_name=collection_name, points=batch)
-        total_upserted += len(batch)
-        logger.info("Upserted batch %d-%d (%d total)", i, i + len(batch), total_upserted)
+    if len(nodes) < batch_size * parallel * PARALLEL_UPSERT_MIN_BATCHES:
+        parallel = 1
 
-    return total_upserted
+    # wait=True: callers clear the query cache right after, so points must be visible
+    client.upload_points(
+        collection_name=collection_name,
+        points=_iter_points(nodes, batch_size),
+        batch_size=batch_size,
+        parallel=parallel,
+        max_retries=3,
+        wait=True,
+    )
+    logger.info("Upserted %d points to '%s'", len(nodes), collection_name)
+    return len(nodes)
 
 
 # ── Similarity Search ─────────────────────────────────────────────────────────
@@ -140,6 +260,7 @@ def search_nodes(
     k: int = 3,
     collection_name: str = QDRANT_COLLECTION,
     score_threshold: float = 0.0,
+    query_vector: Optional[list[float]] = None,
 ) -> list[dict]:
     """
     Perform a similarity search in Qdrant.
@@ -149,18 +270,21 @@ def search_nodes(
         k:                Number of results to return.
         collection_name:  Qdrant collection to search.
         score_threshold:  Minimum cosine similarity score (0 = no filter).
+        query_vector:     Pre-computed embedding of `query` (skips re-embedding).
 
     Returns:
         List of payload dicts (each is a full EnergyNode record) sorted by score.
     """
     client = get_client()
-    query_vector = embed_text(query)
+    if query_vector is None:
+        query_vector = embed_text(query)
+    threshold = score_threshold if score_threshold > 0 else None
 
     results: list[ScoredPoint] = client.search(
         collection_name=collection_name,
         query_vector=query_vector,
         limit=k,
-        score_threshold=score_threshold if score_threshold > 0 else None,
+        score_threshold=threshold,
         with_payload=True,
     )
 
@@ -0,0 +1,181 @@
+"""
+query_cache.py — Two-tier cache in front of /query similarity search.
+
+  1. Exact tier:    in-memory LRU keyed by sha256(query, k, score_threshold).
+  2. Semantic tier: small Qdrant collection of previously-seen query vectors;
+                    a new query whose vector is within SEMANTIC_CACHE_THRESHOLD
+                    cosine similarity of a cached one reuses its results. Points
+                    live in QUERY_CACHE_SIZE ring-buffer slots, so the newest
+                    entry overwrites the oldest once the tier is full.
+
+Both tiers are invalidated via clear() whenever new nodes are upserted. clear()
+also bumps a generation counter: a /query that looked up the cache before the
+ingest passes that generation to put(), which then drops its pre-ingest results.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from dotenv import load_dotenv
+from qdrant_client.models import FieldCondition, Filter, MatchValue, PointStruct
+
+from app.services.qdrant_db import ensure_collection, get_client
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# ── Config ─────────────────────────────────────────────────────────────────────
+QUERY_CACHE_COLLECTION = os.getenv("QUERY_CACHE_COLLECTION", "souli_query_cache")
+QUERY_CACHE_SIZE = int(os.getenv("QUERY_CACHE_SIZE", "1000"))
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.92"))
+
+_lru: "OrderedDict[str, list[dict]]" = OrderedDict()
+# /query runs in FastAPI's threadpool and clear() runs from ingest threads
+_lock = threading.Lock()
+# Set once the semantic-tier collection is known to exist; reset by clear()
+_collection_ready = False
+# Bumped by clear(); results computed under an older generation are not stored
+_generation = 0
+# Next semantic-tier ring-buffer slot (point ID), modulo QUERY_CACHE_SIZE
+_next_slot = 0
+
+
+def _cache_key(query: str, k: int, score_threshold: float) -> str:
+    raw = f"{query.strip().lower()}\x00{k}\x00{score_threshold}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _lru_put(key: str, results: list[dict], generation: int) -> bool:
+    """Store in the exact tier unless clear() ran since `generation`; returns whether it stored."""
+    with _lock:
+        if generation != _generation:
+            return False
+        _lru[key] = results
+        _lru.move_to_end(key)
+        while len(_lru) > QUERY_CACHE_SIZE:
+            _lru.popitem(last=False)
+    return True
+
+
+def _ensure_cache_collection(client) -> None:
+    """ensure_collection for the semantic tier, skipped once it is known to exist."""
+    global _collection_ready
+    if not _collection_ready:
+        ensure_collection(client, QUERY_CACHE_COLLECTION)
+        _collection_ready = True
+
+
+# ── Lookup ────────────────────────────────────────────────────────────────────
+def get_exact(query: str, k: int, score_threshold: float) -> tuple[Optional[list[dict]], int]:
+    """
+    Return (cached results for an identical (normalized) query or None, cache
+    generation). Pass the generation to put() so results computed across a
+    clear() are not stored.
+    """
+    key = _cache_key(query, k, score_threshold)
+    with _lock:
+        generation = _generation
+        results = _lru.get(key)
+        if results is not None:
+            _lru.move_to_end(key)
+    if results is not None:
+        logger.debug("Query cache exact hit: %r", query[:80])
+    return results, generation
+
+
+def get_similar(
+    query: str,
+    query_vector: list[float],
+    k: int,
+    score_threshold: float,
+    generation: int,
+) -> Optional[list[dict]]:
+    """
+    Return cached results for a semantically equivalent query, or None.
+    Only entries stored with the same k / score_threshold are considered.
+    """
+    client = get_client()
+    _ensure_cache_collection(client)
+
+    hits = client.search(
+        collection_name=QUERY_CACHE_COLLECTION,
+        query_vector=query_vector,
+        query_filter=Filter(
+            must=[
+                FieldCondition(key="k", match=MatchValue(value=k)),
+                FieldCondition(key="score_threshold", match=MatchValue(value=str(score_threshold))),
+            ]
+        ),
+        limit=1,
+        score_threshold=SEMANTIC_CACHE_THRESHOLD,
+        with_payload=True,
+    )
+    if not hits:
+        return None
+
+    results = json.loads(hits[0].payload["results"])
+    _lru_put(_cache_key(query, k, score_threshold), results, generation)
+    logger.info("Query cache semantic hit (score=%.3f): %r", hits[0].score, query[:80])
+    return results
+
+
+# ── Store ─────────────────────────────────────────────────────────────────────
+def put(
+    query: str,
+    query_vector: list[float],
+    k: int,
+    score_threshold: float,
+    results: list[dict],
+    generation: int,
+) -> None:
+    """
+    Store search results in both cache tiers, unless clear() has run since
+    `generation` (from get_exact) — they would predate the new nodes.
+    """
+    global _next_slot
+    key = _cache_key(query, k, score_threshold)
+    if not _lru_put(key, results, generation):
+        logger.debug("Query cache skipped stale results: %r", query[:80])
+        return
+    with _lock:
+        slot = _next_slot
+        _next_slot = (_next_slot + 1) % QUERY_CACHE_SIZE
+
+    client = get_client()
+    _ensure_cache_collection(client)
+    client.upsert(
+        collection_name=QUERY_CACHE_COLLECTION,
+        points=[
+            PointStruct(
+                id=slot,
+                vector=query_vector,
+                payload={
+                    "query": query,
+                    "k": k,
+                    "score_threshold": str(score_threshold),
+                    "results": json.dumps(results),
+                },
+            )
+        ],
+    )
+
+
+def clear() -> None:
+    """Drop all cached query results (call after the knowledge base changes)."""
+    global _collection_ready, _generation
+    with _lock:
+        _generation += 1
+        _lru.clear()
+    client = get_client()
+    existing = [c.name for c in client.get_collections().collections]
+    if QUERY_CACHE_COLLECTION in existing:
+        client.delete_collection(QUERY_CACHE_COLLECTION)
+    # Reset after the delete so a concurrent put can't leave a stale "ready" flag
+    _collection_ready = False
+    logger.info("Query cache cleared")
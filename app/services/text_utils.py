@@ -4,11 +4,45 @@ text_utils.py — YouTube transcript fetching and cleaning utilities.
 
 import re
 import logging
-from urllib.parse import urlparse, parse_qs
 from youtube_transcript_api import YouTubeTranscriptApi, NoTranscriptFound, TranscriptsDisabled
 
 logger = logging.getLogger(__name__)
 
+# YouTube video ID from watch?v= / youtu.be / shorts / embed / v URLs
+_YT_ID = re.compile(
+    r"(?:youtube\.com/(?:watch\?(?:[^#]*&)?v=|shorts/|embed/|v/)|youtu\.be/)"
+    r"([A-Za-z0-9_-]{11})(?![A-Za-z0-9_-])"  # exactly 11 — a longer ID is not truncated
+)
+
+# ── Precompiled cleaning patterns ─────────────────────────────────────────────
+# Speaker labels at line start — e.g. "John:", "Host:", "Speaker 2:"
+_SPEAKER = re.compile(r"^[A-Za-z][A-Za-z0-9 _]{0,30}:\s*", re.MULTILINE)
+# Common marketing filler
+_FILLER_PATTERNS = [
+    r"subscribe\s+to\s+my\s+channel",
+    r"like\s+and\s+subscribe",
+    r"hit\s+the\s+notification\s+bell",
+    r"follow\s+me\s+on\s+(?:instagram|twitter|facebook|tiktok)",
+    r"check\s+out\s+my\s+(?:website|link\s+in\s+bio)",
+    r"use\s+code\s+\w+\s+for\s+\d+%?\s+off",
+    r"sponsored\s+by",
+    r"this\s+video\s+is\s+brought\s+to\s+you\s+by",
+]
+# Bracketed content (e.g. [Music], [00:01:23]) — stripped before speaker labels
+# so "Speaker [1]: hello" still loses its label
+_BRACKETS = re.compile(r"\[.*?\]")
+# Timestamps (HH:MM:SS or MM:SS) | marketing filler — one alternation pass
+_NOISE = re.compile(
+    "|".join(
+        [r"\b\d{1,2}:\d{2}(?::\d{2})?\b"]
+        + [f"(?:{p})" for p in _FILLER_PATTERNS]
+    ),
+    re.IGNORECASE,
+)
+_WHITESPACE = re.compile(r"\s+")
+# A segment that is nothing but one bracketed cue — e.g. "[Music]"
+_BRACKET_CUE = re.compile(r"^\[[^\]]*\]$")
+
 
 def extract_video_id(url: str) -> str:
     """
@@ -17,25 +51,27 @@ def extract_video_id(url: str) -> str:
       - https://youtu.be/VIDEO_ID
       - https://youtube.com/shorts/VIDEO_ID
     """
-    parsed = urlparse(url.strip())
-
-    if parsed.netloc in ("youtu.be",):
-        # https://youtu.be/VIDEO_ID
-        return parsed.path.lstrip("/")
-
-    if "youtube.com" in parsed.netloc:
-        qs = parse_qs(parsed.query)
-        if "v" in qs:
-            return qs["v"][0]
-        # Shorts / embed
-        path_parts = parsed.path.split("/")
-        for i, part in enumerate(path_parts):
-            if part in ("shorts", "embed", "v") and i + 1 < len(path_parts):
-                return path_parts[i + 1]
+    match = _YT_ID.search(url)
+    if match:
+        return match.group(1)
 
     raise ValueError(f"Cannot extract video ID from URL: {url!r}")
 
 
+def _join_segments(segments) -> str:
+    """
+    Join transcript segments into one string, dropping empty segments and
+    bracket-only cues such as "[Music]" before they reach clean_transcript.
+    """
+    kept = []
+    for seg in segments:
+        stripped = seg.text.strip()
+        # Only whole-segment cues are dropped; "[Music] so today…" keeps its speech
+        if stripped and not _BRACKET_CUE.match(stripped):
+            kept.append(seg.text)
+    return " ".join(kept)
+
+
 def fetch_transcript(yt_url: str, languages: list[str] | None = None) -> tuple[str, str]:
     """
     Fetch and concatenate the transcript for a YouTube video.
@@ -56,7 +92,7 @@ def fetch_transcript(yt_url: str, languages: list[str] | None = None) -> tuple[s
 
     try:
         segments = api.fetch(video_id, languages=languages)
-        text = " ".join(seg.text for seg in segments)
+        text = _join_segments(segments)
         return video_id, text
     except NoTranscriptFound:
         # Fallback: try auto-generated transcript
@@ -64,7 +100,7 @@ def fetch_transcript(yt_url: str, languages: list[str] | None = None) -> tuple[s
             transcript_list = api.list(video_id)
             transcript = transcript_list.find_generated_transcript(["en"])
             segments = transcript.fetch()
-            text = " ".join(seg.text for seg in segments)
+            text = _join_segments(segments)
             return video_id, text
         except Exception as inner_exc:
             raise RuntimeError(
@@ -87,30 +123,16 @@ def clean_transcript(raw: str) -> str:
     text = raw
 
     # Remove bracketed content (timestamps, sound effects)
-    text = re.sub(r"\[.*?\]", " ", text)
+    text = _BRACKETS.sub(" ", text)
 
     # Remove speaker labels (e.g. "John:", "Host:", "Speaker 2:")
-    text = re.sub(r"^[A-Za-z][A-Za-z0-9 _]{0,30}:\s*", "", text, flags=re.MULTILINE)
-
-    # Remove timestamp patterns (HH:MM:SS or MM:SS)
-    text = re.sub(r"\b\d{1,2}:\d{2}(?::\d{2})?\b", " ", text)
-
-    # Remove common marketing filler
-    filler_patterns = [
-        r"subscribe\s+to\s+my\s+channel",
-        r"like\s+and\s+subscribe",
-        r"hit\s+the\s+notification\s+bell",
-        r"follow\s+me\s+on\s+(instagram|twitter|facebook|tiktok)",
-        r"check\s+out\s+my\s+(website|link\s+in\s+bio)",
-        r"use\s+code\s+\w+\s+for\s+\d+%?\s+off",
-        r"sponsored\s+by",
-        r"this\s+video\s+is\s+brought\s+to\s+you\s+by",
-    ]
-    for pattern in filler_patterns:
-        text = re.sub(pattern, " ", text, flags=re.IGNORECASE)
+    text = _SPEAKER.sub("", text)
+
+    # Remove timestamps and common marketing filler
+    text = _NOISE.sub(" ", text)
 
     # Collapse whitespace
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _WHITESPACE.sub(" ", text).strip()
 
     return text
 
@@ -123,10 +145,10 @@ def truncate_transcript(text: str, max_chars: int = 12_000) -> str:
     if len(text) <= max_chars:
         return text
 
-    truncated = text[:max_chars]
-    # Try to end at a sentence boundary
-    last_period = truncated.rfind(".")
-    if last_period > max_chars * 0.8:
-        truncated = truncated[: last_period + 1]
+    # Try to end at a sentence boundary — only periods past 80% qualify, so
+    # search just that tail instead of the whole window
+    last_period = text.rfind(".", int(max_chars * 0.8) + 1, max_chars)
+    if last_period != -1:
+        return text[: last_period + 1].strip()
 
-    return truncated.strip()
+    return text[:max_chars].strip()
@@ -0,0 +1,128 @@
+"""
+tests/test_batch_extraction.py — Unit tests for multi-transcript (batched) extraction.
+
+The LLM is stubbed with canned responses; no LLM, YouTube, or Qdrant access required.
+"""
+
+import json
+
+import pytest
+
+from app.services import extract_cache, extractor
+from app.services.extractor import _call_llm_and_parse_batch, extract_energy_nodes_batch
+
+
+def _raw_node(question: str) -> dict:
+    return {
+        "main_question": question,
+        "category": "Grief",
+        "diagnostic_layer": {
+            "related_inner_issues": "avoidance",
+            "reality_commitment_check": "Do I let myself feel the loss?",
+            "hidden_benefit": "not facing the pain",
+            "energy_node": "Frozen Heart",
+        },
+        "pillars": {
+            "intervention_narrative": "Grief is circular, not linear.",
+            "intervention_action": "Write a letter to what you have lost.",
+            "intervention_shift": "Grief is not the opposite of healing.",
+        },
+        "atmosphere": {"tone": "gentle", "pacing": "slow"},
+        "overflow": [],
+    }
+
+
+@pytest.fixture(autouse=True)
+def _no_extract_cache(monkeypatch):
+    """Keep cached extractions from earlier runs out of these tests."""
+    monkeypatch.setattr(extract_cache, "EXTRACT_CACHE_ENABLED", False)
+
+
+def _stub_llm(monkeypatch, entries: list) -> list[str]:
+    """Make every LLM call return `entries` as JSON; returns the prompts it received."""
+    prompts: list[str] = []
+
+    def _invoke(prompt: str) -> str:
+        prompts.append(prompt)
+        return "Here are the results:\n" + json.dumps(entries)
+
+    monkeypatch.setattr(extractor, "_invoke_llm", _invoke)
+    return prompts
+
+
+def test_batch_response_mapped_by_id(monkeypatch):
+    """Entries map back by their 1-based id, whatever order the model returns them in."""
+    _stub_llm(monkeypatch, [
+        {"id": 2, "nodes": [_raw_node("second")]},
+        {"id": 1, "nodes": [_raw_node("first")]},
+    ])
+    by_index = _call_llm_and_parse_batch(["transcript one", "transcript two"])
+    assert by_index[0][0]["main_question"] == "first"
+    assert by_index[1][0]["main_question"] == "second"
+
+
+def test_malformed_batch_entries_ignored(monkeypatch):
+    """Entries with a bad id, an out-of-range id or non-list nodes are left out."""
+    _stub_llm(monkeypatch, [
+        {"id": 1, "nodes": [_raw_node("first")]},
+        {"id": "two", "nodes": [_raw_node("bad id")]},
+        {"id": 2, "nodes": "not a list"},
+        {"id": 9, "nodes": [_raw_node("out of range")]},
+        "not an object",
+    ])
+    by_index = _call_llm_and_parse_batch(["transcript one", "transcript two"])
+    assert list(by_index) == [0]
+
+
+def test_batch_without_entries_raises(monkeypatch):
+    """A response with no usable entries raises so the caller can retry or fall back."""
+    _stub_llm(monkeypatch, [{"id": "x", "nodes": []}])
+    with pytest.raises(ValueError):
+        _call_llm_and_parse_batch.__wrapped__(["transcript one", "transcript two"])
+
+
+def test_missing_entry_falls_back_to_single_extraction(monkeypatch):
+    """Videos the batch omitted are extracted individually; the rest keep their batch nodes."""
+    _stub_llm(monkeypatch, [
+        {"id": 1, "nodes": [_raw_node("first")]},
+        {"id": 3, "nodes": [_raw_node("third")]},
+    ])
+    single_calls: list[str] = []
+
+    def _single(transcript, video_id, video_url, max_chars=12_000):
+        single_calls.append(video_id)
+        return []
+
+    monkeypatch.setattr(extractor, "extract_energy_nodes", _single)
+    items = [
+        ("transcript one", "vid1", "https://youtu.be/vid1"),
+        ("transcript two", "vid2", "https://youtu.be/vid2"),
+        ("transcript three", "vid3", "https://youtu.be/vid3"),
+    ]
+    results = extract_energy_nodes_batch(items)
+
+    assert single_calls == ["vid2"]
+    assert [n.main_question for n in results[0]] == ["first"]
+    assert results[1] == []
+    assert [n.main_question for n in results[2]] == ["third"]
+    assert results[2][0].video_id == "vid3"
+    assert results[2][0].video_url == "https://youtu.be/vid3"
+
+
+def test_malformed_entry_yields_no_nodes(monkeypatch):
+    """An entry whose nodes all fail validation yields [] for that video only."""
+    broken = _raw_node("broken")
+    del broken["pillars"]
+    prompts = _stub_llm(monkeypatch, [
+        {"id": 1, "nodes": [broken]},
+        {"id": 2, "nodes": [_raw_node("second")]},
+    ])
+    items = [
+        ("transcript one", "vid1", "https://youtu.be/vid1"),
+        ("transcript two", "vid2", "https://youtu.be/vid2"),
+    ]
+    results = extract_energy_nodes_batch(items)
+
+    assert len(prompts) == 1
+    assert results[0] == []
+    assert [n.video_id for n in results[1]] == ["vid2"]
@@ -8,9 +8,16 @@ Requires either:
 """
 
 import pytest
+from app.services import extract_cache
 from app.services.extractor import extract_energy_nodes
 from app.models.metadata import EnergyNode, DiagnosticLayer
 
+
+@pytest.fixture(autouse=True)
+def _no_extract_cache(monkeypatch):
+    """Hit the LLM on every call — a cached extraction would mask regressions."""
+    monkeypatch.setattr(extract_cache, "EXTRACT_CACHE_ENABLED", False)
+
 # A realistic coaching transcript excerpt covering three distinct use-cases
 SAMPLE_TRANSCRIPT = """
 When you feel overwhelmed, your nervous system is not broken — it is working exactly as designed.
@@ -0,0 +1,68 @@
+"""
+tests/test_json_extraction.py — Unit tests for LLM-response JSON array extraction.
+
+Pure parsing tests; no LLM, YouTube, or Qdrant access required.
+"""
+
+import pytest
+from app.services.extractor import _extract_json_array, _find_json_array
+
+
+def test_direct_array():
+    """A bare JSON array should parse directly."""
+    assert _extract_json_array('[{"a": 1}, {"b": 2}]') == [{"a": 1}, {"b": 2}]
+
+
+def test_markdown_fences_stripped():
+    """Arrays wrapped in ```json fences should parse."""
+    text = '```json\n[{"a": 1}]\n```'
+    assert _extract_json_array(text) == [{"a": 1}]
+
+
+def test_prose_before_and_after():
+    """Trailing prose containing brackets must not break extraction."""
+    text = 'Here you go:\n[{"a": 1}]\nHope this helps [really]!'
+    assert _extract_json_array(text) == [{"a": 1}]
+
+
+def test_brackets_inside_strings_ignored():
+    """Brackets and escaped quotes inside string literals do not affect depth."""
+    text = 'Output: [{"q": "what [if] \\"]\\" appears?"}] done'
+    assert _extract_json_array(text) == [{"q": 'what [if] "]" appears?'}]
+
+
+def test_skips_non_json_bracket_prefix():
+    """A non-JSON bracketed note before the array is skipped."""
+    text = '[Note: analysis below]\n[{"a": 1}]'
+    assert _extract_json_array(text) == [{"a": 1}]
+
+
+def test_malformed_outer_array_does_not_return_nested_list():
+    """A trailing comma in the outer array raises rather than yielding the inner overflow list."""
+    text = '[{"main_question":"q","overflow":["gem one","gem two"]},]'
+    with pytest.raises(ValueError):
+        _extract_json_array(text)
+
+
+def test_skips_unbalanced_bracket_prefix():
+    """An opening bracket that never closes does not hide the array after it."""
+    text = 'Note: [see below\n[{"a": 1}]'
+    assert _extract_json_array(text) == [{"a": 1}]
+
+
+def test_truncated_response_does_not_return_nested_list():
+    """A cut-off response raises rather than yielding its inner overflow list."""
+    text = '[{"main_question":"q","overflow":["gem one","gem two"]}, {"main_question":'
+    with pytest.raises(ValueError):
+        _extract_json_array(text)
+
+
+def test_find_json_array_unbalanced():
+    """An unterminated array yields no span."""
+    assert _find_json_array('[{"a": 1}') is None
+
+
+def test_no_array_raises():
+    """Responses without any JSON array raise ValueError."""
+    with pytest.raises(ValueError):
+        _extract_json_array("I could not find any use-cases.")
@@ -0,0 +1,75 @@
+"""
+tests/test_read_links.py — Unit tests for CSV link parsing in /process-csv.
+
+Reads small CSVs from a temp dir; no LLM, YouTube, or Qdrant access required.
+"""
+
+import pytest
+from fastapi import HTTPException
+
+from app.main import _read_links
+
+
+def _write_csv(tmp_path, text: str) -> str:
+    path = tmp_path / "links.csv"
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.parametrize("header", ["yt_link", "YT_Link", " yt link ", "Yt\tLink", "YT  LINK"])
+def test_yt_link_header_normalized(tmp_path, header):
+    """Case plus surrounding and inner whitespace are normalized to yt_link."""
+    path = _write_csv(tmp_path, f"title,{header}\nA,https://youtu.be/aaaaaaaaaaa\n")
+    assert _read_links(path) == ["https://youtu.be/aaaaaaaaaaa"]
+
+
+def test_utf8_bom_header(tmp_path):
+    """A UTF-8 BOM (Excel exports) does not hide the first column's name."""
+    path = tmp_path / "links.csv"
+    path.write_bytes("yt_link,title\nhttps://youtu.be/aaaaaaaaaaa,A\n".encode("utf-8-sig"))
+    assert _read_links(str(path)) == ["https://youtu.be/aaaaaaaaaaa"]
+
+
+@pytest.mark.parametrize("header", ["Video URL", "youtube", "link"])
+def test_alternate_link_columns(tmp_path, header):
+    """Without yt_link, a column mentioning link / url / youtube is used."""
+    path = _write_csv(tmp_path, f"title,{header}\nA,https://youtu.be/aaaaaaaaaaa\n")
+    assert _read_links(path) == ["https://youtu.be/aaaaaaaaaaa"]
+
+
+def test_yt_link_preferred_over_alternates(tmp_path):
+    """An exact yt_link column wins over other link-like columns."""
+    path = _write_csv(tmp_path, "source_url,yt_link\nhttps://example.com,https://youtu.be/aaaaaaaaaaa\n")
+    assert _read_links(path) == ["https://youtu.be/aaaaaaaaaaa"]
+
+
+def test_missing_link_column_raises_422(tmp_path):
+    """A CSV with no link-like column is rejected with 422 naming the columns found."""
+    path = _write_csv(tmp_path, "title,notes\nA,B\n")
+    with pytest.raises(HTTPException) as exc_info:
+        _read_links(path)
+    assert exc_info.value.status_code == 422
+    assert "title" in exc_info.value.detail
+
+
+def test_links_deduplicated_in_file_order(tmp_path):
+    """Repeated (after stripping) and empty links are dropped; first occurrences keep file order."""
+    path = _write_csv(
+        tmp_path,
+        "yt_link\n"
+        "https://youtu.be/bbbbbbbbbbb\n"
+        " https://youtu.be/aaaaaaaaaaa \n"
+        "\n"
+        ",\n"
+        "https://youtu.be/bbbbbbbbbbb\n"
+        "https://youtu.be/aaaaaaaaaaa\n",
+    )
+    assert _read_links(path) == ["https://youtu.be/bbbbbbbbbbb", "https://youtu.be/aaaaaaaaaaa"]
+
+
+def test_seen_links_skipped_across_chunks(tmp_path):
+    """Links already in `seen` (from earlier chunks of an upload) are skipped and recorded."""
+    seen = {"https://youtu.be/aaaaaaaaaaa"}
+    path = _write_csv(tmp_path, "yt_link\nhttps://youtu.be/aaaaaaaaaaa\nhttps://youtu.be/bbbbbbbbbbb\n")
+    assert _read_links(path, seen) == ["https://youtu.be/bbbbbbbbbbb"]
+    assert seen == {"https://youtu.be/aaaaaaaaaaa", "https://youtu.be/bbbbbbbbbbb"}
@@ -0,0 +1,25 @@
+"""
+tests/test_transcript_segments.py — Unit tests for joining transcript segments.
+
+Segments are stubbed; no YouTube access required.
+"""
+
+from types import SimpleNamespace
+
+from app.services.text_utils import _join_segments
+
+
+def _segments(*texts):
+    return [SimpleNamespace(text=t) for t in texts]
+
+
+def test_drops_empty_and_cue_only_segments():
+    """Blank segments and whole-segment cues like "[Music]" are dropped."""
+    segments = _segments("[Music]", "  ", "hello there", " [Applause] ")
+    assert _join_segments(segments) == "hello there"
+
+
+def test_keeps_speech_between_cues():
+    """A segment with speech between two cues is kept whole for clean_transcript."""
+    segments = _segments("[Music] so today we talk [Applause]", "about rest")
+    assert _join_segments(segments) == "[Music] so today we talk [Applause] about rest"
@@ -0,0 +1,66 @@
+"""
+tests/test_validate_nodes.py — Unit tests for validating raw LLM node dicts.
+
+Pure pydantic validation; no LLM, YouTube, or Qdrant access required.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from app.models.metadata import EnergyNode
+from app.services.extractor import _RAW_NODES_ADAPTER, _validate_nodes
+
+VIDEO_ID = "test123"
+VIDEO_URL = "https://youtube.com/watch?v=test123"
+
+
+def _raw_node(question: str) -> dict:
+    return {
+        "main_question": question,
+        "category": "Burnout",
+        "diagnostic_layer": {
+            "related_inner_issues": "people-pleasing",
+            "reality_commitment_check": "Do I rest only when exhausted?",
+            "hidden_benefit": "feeling needed",
+            "energy_node": "Depleted Giver",
+        },
+        "pillars": {
+            "intervention_narrative": "Rest is the foundation work grows from.",
+            "intervention_action": "Schedule fifteen guilt-free minutes of rest.",
+            "intervention_shift": "I am productive because I rest.",
+        },
+        "atmosphere": {"tone": "warm", "pacing": "slow"},
+        "overflow": ["rest is not a reward"],
+    }
+
+
+def test_fast_path_attaches_provenance():
+    """An all-valid list takes the one-pass path and carries video_id / video_url."""
+    nodes = _validate_nodes([_raw_node("q1"), _raw_node("q2")], VIDEO_ID, VIDEO_URL)
+    assert [n.main_question for n in nodes] == ["q1", "q2"]
+    assert all(isinstance(n, EnergyNode) for n in nodes)
+    assert all(n.video_id == VIDEO_ID and n.video_url == VIDEO_URL for n in nodes)
+
+
+def test_bad_node_falls_back_and_is_dropped():
+    """One invalid node fails the one-pass validation; the per-node path keeps the rest."""
+    bad = _raw_node("bad")
+    del bad["pillars"]
+    raw_list = [_raw_node("q1"), bad, _raw_node("q2")]
+
+    with pytest.raises(ValidationError):
+        _RAW_NODES_ADAPTER.validate_python(raw_list)
+    nodes = _validate_nodes(raw_list, VIDEO_ID, VIDEO_URL)
+    assert [n.main_question for n in nodes] == ["q1", "q2"]
+
+
+def test_valid_nodes_identical_on_both_paths():
+    """Valid nodes come out the same whether validated in one pass or per node."""
+    bad = _raw_node("bad")
+    bad["atmosphere"] = "calm"
+    fast = _validate_nodes([_raw_node("q1"), _raw_node("q2")], VIDEO_ID, VIDEO_URL)
+    fallback = _validate_nodes([_raw_node("q1"), bad, _raw_node("q2")], VIDEO_ID, VIDEO_URL)
+
+    assert [n.model_dump() for n in fast] == [n.model_dump() for n in fallback]
+    assert [n.to_payload() for n in fast] == [n.to_payload() for n in fallback]
+    assert [n.embed_text() for n in fast] == [n.embed_text() for n in fallback]
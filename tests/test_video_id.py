@@ -0,0 +1,36 @@
+"""
+tests/test_video_id.py — Unit tests for YouTube video-ID extraction.
+
+Pure URL parsing; no network access required.
+"""
+
+import pytest
+from app.services.text_utils import extract_video_id
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://m.youtube.com/watch?feature=share&v=dQw4w9WgXcQ",
+        "https://youtu.be/dQw4w9WgXcQ?t=42",
+        "https://youtube.com/shorts/dQw4w9WgXcQ",
+        "https://www.youtube.com/embed/dQw4w9WgXcQ",
+        "  https://www.youtube.com/watch?v=dQw4w9WgXcQ  ",
+    ],
+)
+def test_supported_url_shapes(url):
+    """Every supported URL shape yields the 11-char video ID."""
+    assert extract_video_id(url) == "dQw4w9WgXcQ"
+
+
+def test_non_youtube_url_raises():
+    """A v= parameter on another host is not treated as a YouTube ID."""
+    with pytest.raises(ValueError):
+        extract_video_id("https://example.com/watch?v=dQw4w9WgXcQ")
+
+
+def test_overlong_id_raises():
+    """An ID longer than 11 characters is rejected, not truncated to another video."""
+    with pytest.raises(ValueError):
+        extract_video_id("https://youtu.be/dQw4w9WgXcQXYZ")
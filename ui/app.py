@@ -13,17 +13,31 @@ Tab 2: Chat Sandbox
   - Displays Story, Action, and Vibe cards
 """
 
-import os
+import hashlib
+import html
 import io
+import os
 import json
+import shutil
+import tempfile
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 import httpx
-import pandas as pd
 import streamlit as st
 
 # ── Config ────────────────────────────────────────────────────────────────────
 API_BASE = os.getenv("API_BASE_URL", "http://localhost:8000")
+# Connection attempts retried by the transport (safe for POSTs: nothing was sent yet)
+RETRIES = int(os.getenv("API_RETRIES", "3"))
+# Gateway errors worth re-polling through instead of abandoning an ingestion
+TRANSIENT_STATUSES = {502, 503, 504}
+# Links per /process-csv request — large CSVs are sent as several ingest tasks.
+# At ~3–6 nodes per link, a chunk only takes the server's deferred-indexing bulk
+# path once it exceeds QDRANT_BULK_INDEX_THRESHOLD nodes (≈1000+ links at 5000)
+UPLOAD_CHUNK_ROWS = int(os.getenv("UPLOAD_CHUNK_ROWS", "500"))
+POOL_TIMEOUT_MESSAGE = "The API is busy (connection pool exhausted) — please try again in a moment."
 
 st.set_page_config(
     page_title="Souli — Admin Dashboard",
@@ -32,70 +46,58 @@ st.set_page_config(
     initial_sidebar_state="collapsed",
 )
 
+# ── Result Card Templates ─────────────────────────────────────────────────────
+# Built once at import; the results loop only fills them in
+STORY_CARD = (
+    '<div class="card"><div class="card-title">📖 The Story (Narrative)</div>'
+    '<div class="card-body">{v}</div></div>'
+)
+ACTION_CARD = (
+    '<div class="card"><div class="card-title">🎯 The Action (Exercise)</div>'
+    '<div class="card-body">{v}</div></div>'
+)
+SHIFT_CARD = (
+    '<div class="card"><div class="card-title">✨ The Shift (One-liner)</div>'
+    '<div class="card-body">{v}</div></div>'
+)
+META_ROW = (
+    '<div class="meta-row"><div><b>🎭 Tone:</b> {tone}</div>'
+    '<div><b>⏱ Pacing:</b> {pacing}</div></div>'
+)
+GEMS_BLOCK = "<p><b>💎 Gems &amp; Notable Phrases:</b></p><p>{tags}</p>"
+GEM_TAG = '<span class="overflow-tag">{v}</span>'
+# Gems beyond this are summarised as "+N more" to bound per-node HTML
+MAX_GEM_TAGS = 25
+SOURCE_LINE = '<small>🔗 Source: <a href="{url}" target="_blank">{url}</a></small>'
+
+
+def _escape(value) -> str:
+    """HTML-escape a result field (quotes included) for the unsafe_allow_html cards."""
+    return html.escape(str(value), quote=True)
+
+
 # ── Custom CSS ────────────────────────────────────────────────────────────────
-st.markdown(
-    """
-    <style>
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;600;700&display=swap');
-
-    html, body, [class*="css"] {
-        font-family: 'Inter', sans-serif;
-    }
-    .souli-header {
-        font-size: 2.4rem;
-        font-weight: 700;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        margin-bottom: 0.25rem;
-    }
-    .souli-sub {
-        color: #6B7280;
-        font-size: 1.05rem;
-        margin-bottom: 2rem;
-    }
-    .card {
-        background: #F9FAFB;
-        border-radius: 12px;
-        padding: 1.2rem 1.4rem;
-        margin-bottom: 1rem;
-        border-left: 4px solid #667eea;
-    }
-    .card-title {
-        font-weight: 600;
-        font-size: 0.85rem;
-        text-transform: uppercase;
-        letter-spacing: 0.08em;
-        color: #667eea;
-        margin-bottom: 0.4rem;
-    }
-    .card-body {
-        font-size: 1rem;
-        color: #1F2937;
-        line-height: 1.7;
-    }
-    .overflow-tag {
-        display: inline-block;
-        background: #EDE9FE;
-        color: #5B21B6;
-        border-radius: 999px;
-        padding: 0.2rem 0.75rem;
-        font-size: 0.82rem;
-        margin: 0.2rem 0.2rem 0.2rem 0;
-    }
-    .score-badge {
-        background: #D1FAE5;
-        color: #065F46;
-        border-radius: 6px;
-        padding: 0.15rem 0.5rem;
-        font-size: 0.8rem;
-        font-weight: 600;
-    }
-    hr { border-color: #E5E7EB; }
-    </style>
-    """,
-    unsafe_allow_html=True,
+# Pre-minified, one rule per literal. Inter is used only if installed locally
+# (no Google Fonts @import blocking first paint); otherwise the system UI font.
+CSS = (
+    "@font-face{font-family:'Inter';src:local('Inter'),local('Inter-Regular');font-display:swap}"
+    "html,body,[class*=\"css\"]{font-family:'Inter',-apple-system,BlinkMacSystemFont,'Segoe UI',Roboto,sans-serif}"
+    ".souli-header{font-size:2.4rem;font-weight:700;background:linear-gradient(135deg,#667eea 0%,#764ba2 100%);"
+    "-webkit-background-clip:text;-webkit-text-fill-color:transparent;margin-bottom:0.25rem}"
+    ".souli-sub{color:#6B7280;font-size:1.05rem;margin-bottom:2rem}"
+    ".card{background:#F9FAFB;border-radius:12px;padding:1.2rem 1.4rem;margin-bottom:1rem;border-left:4px solid #667eea}"
+    ".card-title{font-weight:600;font-size:0.85rem;text-transform:uppercase;letter-spacing:0.08em;color:#667eea;margin-bottom:0.4rem}"
+    ".card-body{font-size:1rem;color:#1F2937;line-height:1.7}"
+    ".overflow-tag{display:inline-block;background:#EDE9FE;color:#5B21B6;border-radius:999px;padding:0.2rem 0.75rem;"
+    "font-size:0.82rem;margin:0.2rem 0.2rem 0.2rem 0}"
+    ".score-badge{background:#D1FAE5;color:#065F46;border-radius:6px;padding:0.15rem 0.5rem;font-size:0.8rem;font-weight:600}"
+    ".meta-row{display:flex;gap:2rem;margin-bottom:1rem}"
+    "hr{border-color:#E5E7EB}"
 )
+# Emitted on every rerun on purpose: Streamlit drops any element a rerun doesn't
+# re-create, so gating this behind session_state would unstyle the page after
+# the first interaction. The minified CSS keeps the per-rerun cost ~1 KB.
+st.markdown(f"<style>{CSS}</style>", unsafe_allow_html=True)
 
 # ── Header ────────────────────────────────────────────────────────────────────
 st.markdown('<div class="souli-header">🌊 Souli Admin Dashboard</div>', unsafe_allow_html=True)
@@ -104,26 +106,221 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
+# ── API Client ────────────────────────────────────────────────────────────────
+@st.cache_resource
+def get_client(base: str) -> httpx.Client:
+    """
+    One pooled keep-alive client per API base, shared across reruns and
+    sessions. An explicit pool timeout surfaces exhaustion instead of hanging.
+    """
+    # Pool sizing and HTTP/2 live on the transport — httpx ignores the
+    # client-level limits/http2 arguments once a transport is supplied
+    transport = httpx.HTTPTransport(
+        http2=True,
+        retries=RETRIES,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+    )
+    return httpx.Client(
+        base_url=base,
+        transport=transport,
+        timeout=httpx.Timeout(30.0, connect=3.0, pool=5.0),
+    )
+
+
+CLIENT = get_client(API_BASE)
+
+
+# Exact repeats (same text + k) are served from the UI without an API round-trip.
+# Errors raise, so they are never cached; cleared after each ingestion.
+@st.cache_data(ttl=300, show_spinner=False)
+def query_api(q: str, k: int) -> dict:
+    """POST /query and return the parsed body; raises httpx.HTTPStatusError on non-2xx."""
+    resp = CLIENT.post("/query", json={"query": q, "k": k}, timeout=30)
+    resp.raise_for_status()
+    return resp.json()
+
+# ── Upload Spooling ───────────────────────────────────────────────────────────
+def _spool_upload(uploaded_file) -> str:
+    """Copy the upload to a temp file in 1 MB chunks; returns its path (caller removes it)."""
+    uploaded_file.seek(0)
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".csv") as tmp:
+        shutil.copyfileobj(uploaded_file, tmp, length=1 << 20)
+    return tmp.name
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _upload_digest(file_id: str, _uploaded_file) -> str:
+    """Content hash of an upload, streamed in 1 MB chunks; computed once per file_id."""
+    _uploaded_file.seek(0)
+    digest = hashlib.blake2b(digest_size=16)
+    for chunk in iter(lambda: _uploaded_file.read(1 << 20), b""):
+        digest.update(chunk)
+    _uploaded_file.seek(0)
+    return digest.hexdigest()
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _preview_upload(digest: str, _uploaded_file):
+    """
+    (first 5 rows, data-row count) for an upload. Cached by content digest, so
+    widget reruns and re-uploads of the same CSV don't re-parse it; only 5 rows
+    are ever handed to pandas.
+    """
+    import pandas as pd  # lazy: ~150 ms import, only needed once a CSV is uploaded
+
+    _uploaded_file.seek(0)
+    preview = pd.read_csv(_uploaded_file, nrows=5)
+    _uploaded_file.seek(0)
+    rows = sum(1 for _ in _uploaded_file) - 1  # minus header
+    _uploaded_file.seek(0)
+    return preview, max(rows, 0)
+
+
+# ── Concurrent Fan-out ────────────────────────────────────────────────────────
+# Independent calls run on threads over the pooled client, so they overlap and
+# still reuse its keep-alive connections (a per-call AsyncClient cannot).
+def _fan_out(*calls) -> list:
+    """Run zero-arg callables concurrently; returns each result or raised exception, in order."""
+    with ThreadPoolExecutor(max_workers=len(calls)) as pool:
+        futures = [pool.submit(call) for call in calls]
+        return [f.exception() or f.result() for f in futures]
+
+
+# ── Chunked Ingestion ─────────────────────────────────────────────────────────
+def _ingest_chunk(buf, name: str, upload_id: str) -> dict:
+    """
+    POST one CSV chunk to /process-csv and poll its background task until it
+    finishes — however long the LLM takes, so the next chunk never overlaps a
+    still-running one. Returns the final task dict (status "completed" or
+    "failed"); raises httpx.HTTPStatusError if the API rejects the chunk or
+    loses the task. `upload_id` lets the API dedup links across chunks.
+    """
+    response = CLIENT.post(
+        "/process-csv",
+        files={"file": (name, buf, "text/csv")},
+        data={"upload_id": upload_id},
+        timeout=60,
+    )
+    response.raise_for_status()
+    task_id = response.json()["task_id"]
+
+    while True:
+        time.sleep(2)
+        response = CLIENT.get(f"/ingest-status/{task_id}", timeout=10)
+        if response.status_code in TRANSIENT_STATUSES:
+            continue  # proxy/API blip — the task keeps running, poll again
+        response.raise_for_status()
+        task = response.json()
+        if task["status"] in ("completed", "failed"):
+            return task
+
+
+def _append_export(fh, task_id: str, skip_header: bool) -> None:
+    """Stream one task's /download-csv export onto `fh` in 1 MB chunks, optionally minus its header row."""
+    with CLIENT.stream("GET", "/download-csv", params={"task_id": task_id}, timeout=300) as resp:
+        resp.raise_for_status()
+        for chunk in resp.iter_bytes(chunk_size=1 << 20):
+            if skip_header:
+                newline = chunk.find(b"\n")
+                if newline == -1:
+                    continue
+                chunk, skip_header = chunk[newline + 1:], False
+            fh.write(chunk)
+
+
+def _render_ingest_result(result: dict) -> None:
+    """Draw the summary, preview table and CSV download for the last completed ingestion."""
+    data = result["data"]
+    if result["chunk_errors"]:
+        st.warning(
+            f"{len(result['chunk_errors'])} of {result['n_chunks']} chunks did not complete:  \n"
+            + "  \n".join(result["chunk_errors"])
+        )
+
+    # ── Summary Metrics ───────────────────────────────────────
+    metrics_slot = st.empty()
+    with metrics_slot.container():
+        m1, m2, m3, m4 = st.columns(4)
+        m1.metric("Links Processed", data["processed_links"])
+        m2.metric("Nodes Extracted", data["total_nodes_extracted"])
+        m3.metric("Upserted to Qdrant", data["total_nodes_upserted"])
+        m4.metric("Failed Links", len(data["failed_links"]))
+
+    if data["failed_links"]:
+        with st.expander("⚠️ Failed Links"):
+            for link in data["failed_links"]:
+                st.code(link)
+
+    # ── Preview Table ─────────────────────────────────────────
+    if data["preview"]:
+        st.markdown("#### 🔍 Extracted Nodes Preview (first 10)")
+        preview_rows = [
+            {
+                "question": n.get("main_question"),
+                "category": n.get("category"),
+                "energy_node": n.get("diagnostic_layer", {}).get("energy_node"),
+                "url": n.get("video_url"),
+            }
+            for n in data["preview"]
+        ]
+        st.dataframe(preview_rows, use_container_width=True)
+
+    # ── Collection stats + Download CSV ───────────────────────
+    if result["points_count"] is not None:
+        st.caption(f"Qdrant now holds **{result['points_count']}** points.")
+
+    if os.path.exists(result["export_path"]):
+        with open(result["export_path"], "rb") as fh:
+            st.download_button(
+                label="⬇ Download Full Extracted CSV",
+                data=fh,
+                file_name="souli_extracted_nodes.csv",
+                mime="text/csv",
+            )
+    else:
+        st.info("CSV download unavailable — check the API server.")
+
+
+def _collection_info(resp):
+    """Parsed /collection-info (None if missing), or False if Qdrant is unreachable."""
+    if isinstance(resp, Exception):
+        return False
+    return resp.json() if resp.status_code == 200 else None
+
+
 # ── API Health Check ──────────────────────────────────────────────────────────
+# Cached so widget interactions (each one is a full rerun) don't re-ping the API.
+# Failures are returned rather than raised so they are cached too.
+@st.cache_data(ttl=10, show_spinner=False)
+def fetch_status(base: str):
+    """
+    (GET /health status code or None if unreachable, collection info) —
+    both requests run concurrently.
+    """
+    client = get_client(base)
+    health_resp, info_resp = _fan_out(
+        lambda: client.get("/health", timeout=3),
+        lambda: client.get("/collection-info", timeout=3),
+    )
+    health_status = None if isinstance(health_resp, Exception) else health_resp.status_code
+    return health_status, _collection_info(info_resp)
+
+
 with st.sidebar:
     st.markdown("### ⚙️ System Status")
-    try:
-        r = httpx.get(f"{API_BASE}/health", timeout=3)
-        if r.status_code == 200:
-            st.success("API: Online ✅")
-        else:
-            st.error("API: Unexpected response")
-    except Exception:
+    health_status, info = fetch_status(API_BASE)
+    if health_status == 200:
+        st.success("API: Online ✅")
+    elif health_status is not None:
+        st.error("API: Unexpected response")
+    else:
         st.error("API: Offline ❌  \nStart FastAPI with:  \n`uvicorn app.main:app --reload`")
 
-    try:
-        r2 = httpx.get(f"{API_BASE}/collection-info", timeout=3)
-        if r2.status_code == 200:
-            info = r2.json()
-            st.info(f"Qdrant: **{info.get('points_count', 0)}** points in `{info.get('collection','')}`")
-        else:
-            st.warning("Qdrant: No collection yet")
-    except Exception:
+    if info:
+        st.info(f"Qdrant: **{info.get('points_count', 0)}** points in `{info.get('collection','')}`")
+    elif info is None:
+        st.warning("Qdrant: No collection yet")
+    else:
         st.warning("Qdrant: Unreachable")
 
     st.markdown("---")
@@ -158,71 +355,116 @@ with tab1:
         )
 
     if uploaded_file:
-        df_preview = pd.read_csv(io.BytesIO(uploaded_file.getvalue()))
-        st.markdown(f"**Detected {len(df_preview)} rows.** Preview:")
-        st.dataframe(df_preview.head(5), use_container_width=True)
+        upload_digest = _upload_digest(uploaded_file.file_id, uploaded_file)
+        df_preview, row_count = _preview_upload(upload_digest, uploaded_file)
+        st.markdown(f"**Detected {row_count} rows.** Preview:")
+        st.dataframe(df_preview, use_container_width=True)
 
         if st.button("🚀 Start Extraction & Ingestion", type="primary"):
             progress_bar = st.progress(0, text="Uploading CSV …")
+            upload_path = _spool_upload(uploaded_file)
+            export_file = tempfile.NamedTemporaryFile(delete=False, suffix=".csv")
+            n_chunks = max(1, -(-row_count // UPLOAD_CHUNK_ROWS))
+            data = {
+                "processed_links": 0,
+                "total_nodes_extracted": 0,
+                "total_nodes_upserted": 0,
+                "failed_links": [],
+                "preview": [],
+            }
+            completed_chunks = 0
+            chunk_errors: list[str] = []
+            keep_export = False
 
             with st.spinner("Processing YouTube links with Llama 3 — this may take a few minutes …"):
                 try:
-                    progress_bar.progress(15, text="Sending to API …")
-                    uploaded_file.seek(0)
-                    response = httpx.post(
-                        f"{API_BASE}/process-csv",
-                        files={"file": (uploaded_file.name, uploaded_file, "text/csv")},
-                        timeout=600,  # 10 min for large batches
+                    # Each chunk is its own ingest task — bounded memory, real
+                    # progress, and one failed chunk doesn't sink the rest.
+                    # Column detection and dedup (across chunks, via upload_id)
+                    # happen on the API.
+                    import pandas as pd
+
+                    upload_id = uuid.uuid4().hex
+                    reader = pd.read_csv(
+                        upload_path, chunksize=UPLOAD_CHUNK_ROWS, dtype=str, keep_default_na=False
                     )
-                    progress_bar.progress(80, text="Processing complete, loading results …")
-
-                    if response.status_code == 200:
-                        data = response.json()
-                        progress_bar.progress(100, text="Done!")
-                        time.sleep(0.5)
+                    for i, chunk_df in enumerate(reader):
+                        progress_bar.progress(
+                            min(100, int(100 * i / n_chunks)),
+                            text=f"Extracting & ingesting chunk {i + 1}/{n_chunks} …",
+                        )
+                        buf = io.BytesIO(chunk_df.to_csv(index=False).encode("utf-8"))
+                        try:
+                            task = _ingest_chunk(buf, f"chunk_{i}.csv", upload_id)
+                        except httpx.HTTPStatusError as exc:
+                            task = {
+                                "status": "failed",
+                                "error": f"API Error {exc.response.status_code}: {exc.response.text}",
+                            }
+                            if exc.response.status_code == 422:
+                                # Bad header/encoding — every chunk shares it
+                                chunk_errors.append(f"Chunk {i + 1}: {task['error']}")
+                                break
+                        if task["status"] != "completed":
+                            chunk_errors.append(f"Chunk {i + 1}: {task.get('error')}")
+                            continue
+
+                        result = task["result"]
+                        for key in ("processed_links", "total_nodes_extracted", "total_nodes_upserted"):
+                            data[key] += result[key]
+                        data["failed_links"].extend(result["failed_links"])
+                        data["preview"].extend(result["preview"][: 10 - len(data["preview"])])
+                        # Each task has its own export — append them in chunk order
+                        _append_export(export_file, task["task_id"], skip_header=completed_chunks > 0)
+                        completed_chunks += 1
+                    export_file.close()
+
+                    if completed_chunks:
                         progress_bar.empty()
+                        st.toast("Ingestion complete", icon="✅")
+                        fetch_status.clear()  # sidebar point count is now stale
+                        query_api.clear()     # cached /query results predate the new nodes
 
-                        # ── Summary Metrics ───────────────────────────────
-                        m1, m2, m3, m4 = st.columns(4)
-                        m1.metric("Links Processed", data["processed_links"])
-                        m2.metric("Nodes Extracted", data["total_nodes_extracted"])
-                        m3.metric("Upserted to Qdrant", data["total_nodes_upserted"])
-                        m4.metric("Failed Links", len(data["failed_links"]))
-
-                        if data["failed_links"]:
-                            with st.expander("⚠️ Failed Links"):
-                                for link in data["failed_links"]:
-                                    st.code(link)
-
-                        # ── Preview Table ─────────────────────────────────
-                        if data["preview"]:
-                            st.markdown("#### 🔍 Extracted Nodes Preview (first 10)")
-                            preview_df = pd.json_normalize(data["preview"])
-                            st.dataframe(preview_df, use_container_width=True)
-
-                        # ── Download CSV ──────────────────────────────────
                         try:
-                            csv_resp = httpx.get(f"{API_BASE}/download-csv", timeout=30)
-                            if csv_resp.status_code == 200:
-                                st.download_button(
-                                    label="⬇ Download Full Extracted CSV",
-                                    data=csv_resp.content,
-                                    file_name="souli_extracted_nodes.csv",
-                                    mime="text/csv",
-                                )
-                        except Exception:
-                            st.info("CSV download unavailable — check the API server.")
+                            info = _collection_info(CLIENT.get("/collection-info", timeout=5))
+                        except httpx.HTTPError as exc:
+                            info = _collection_info(exc)
+
+                        # Kept in session_state so later reruns (e.g. the download
+                        # click) redraw the results without re-ingesting
+                        previous = st.session_state.get("ingest_result")
+                        if previous and os.path.exists(previous["export_path"]):
+                            os.remove(previous["export_path"])
+                        st.session_state["ingest_result"] = {
+                            "data": data,
+                            "chunk_errors": chunk_errors,
+                            "n_chunks": n_chunks,
+                            "points_count": info.get("points_count", 0) if info else None,
+                            "export_path": export_file.name,
+                        }
+                        keep_export = True
 
                     else:
                         progress_bar.empty()
-                        st.error(f"API Error {response.status_code}: {response.text}")
+                        st.error("Ingestion did not complete — " + "; ".join(chunk_errors or ["no rows uploaded"]))
 
+                except httpx.PoolTimeout:
+                    progress_bar.empty()
+                    st.error(POOL_TIMEOUT_MESSAGE)
                 except httpx.ConnectError:
                     progress_bar.empty()
                     st.error("Cannot reach the FastAPI server. Is it running?  \n`uvicorn app.main:app --reload`")
                 except Exception as exc:
                     progress_bar.empty()
                     st.error(f"Unexpected error: {exc}")
+                finally:
+                    export_file.close()
+                    os.remove(upload_path)
+                    if not keep_export:
+                        os.remove(export_file.name)
+
+    if "ingest_result" in st.session_state:
+        _render_ingest_result(st.session_state["ingest_result"])
 
 
 # ════════════════════════════════════════════════════════════════════════════════
@@ -252,77 +494,53 @@ with tab2:
         else:
             with st.spinner("Searching knowledge base …"):
                 try:
-                    resp = httpx.post(
-                        f"{API_BASE}/query",
-                        json={"query": query_input, "k": k_results},
-                        timeout=30,
-                    )
-                    if resp.status_code == 200:
-                        data = resp.json()
-                        results = data.get("results", [])
-
-                        if not results:
-                            st.info("No matching nodes found. Try ingesting more videos first.")
-                        else:
-                            st.markdown(f"#### Found **{len(results)}** coaching insight(s)")
-                            for i, node in enumerate(results):
-                                score = node.get("_score", 0)
-                                with st.expander(
-                                    f"🌀 Node {i+1} — **{node.get('main_question', 'N/A')}**  "
-                                    f"  `{node.get('category', '')}` "
-                                    f"  <span class='score-badge'>Score: {score:.3f}</span>",
-                                    expanded=(i == 0),
-                                ):
-                                    pillars = node.get("pillars", {})
-                                    atmosphere = node.get("atmosphere", {})
-                                    overflow = node.get("overflow", [])
-
-                                    # Story
-                                    st.markdown(
-                                        f"""<div class="card">
-                                        <div class="card-title">📖 The Story (Narrative)</div>
-                                        <div class="card-body">{pillars.get('intervention_narrative', '—')}</div>
-                                        </div>""",
-                                        unsafe_allow_html=True,
-                                    )
-                                    # Action
-                                    st.markdown(
-                                        f"""<div class="card">
-                                        <div class="card-title">🎯 The Action (Exercise)</div>
-                                        <div class="card-body">{pillars.get('intervention_action', '—')}</div>
-                                        </div>""",
-                                        unsafe_allow_html=True,
-                                    )
-                                    # Shift
-                                    st.markdown(
-                                        f"""<div class="card">
-                                        <div class="card-title">✨ The Shift (One-liner)</div>
-                                        <div class="card-body">{pillars.get('intervention_shift', '—')}</div>
-                                        </div>""",
-                                        unsafe_allow_html=True,
-                                    )
-                                    # Atmosphere
-                                    col_tone, col_pace = st.columns(2)
-                                    col_tone.markdown(f"**🎭 Tone:** {atmosphere.get('tone', '—')}")
-                                    col_pace.markdown(f"**⏱ Pacing:** {atmosphere.get('pacing', '—')}")
-
-                                    # Overflow gems
-                                    if overflow:
-                                        st.markdown("**💎 Gems & Notable Phrases:**")
-                                        tags_html = " ".join(
-                                            f'<span class="overflow-tag">{phrase}</span>'
-                                            for phrase in overflow
-                                        )
-                                        st.markdown(tags_html, unsafe_allow_html=True)
-
-                                    # Source
-                                    st.markdown(
-                                        f"<small>🔗 Source: [{node.get('video_url', '')}]({node.get('video_url', '')})</small>",
-                                        unsafe_allow_html=True,
-                                    )
+                    data = query_api(query_input.strip(), k_results)
+                    results = data.get("results", [])
+
+                    if not results:
+                        st.info("No matching nodes found. Try ingesting more videos first.")
                     else:
-                        st.error(f"API Error {resp.status_code}: {resp.text}")
+                        st.markdown(f"#### Found **{len(results)}** coaching insight(s)")
+                        for i, node in enumerate(results):
+                            score = node.get("_score", 0)
+                            with st.expander(
+                                f"🌀 Node {i+1} — **{node.get('main_question', 'N/A')}**  "
+                                f"  `{node.get('category', '')}` "
+                                f"  <span class='score-badge'>Score: {score:.3f}</span>",
+                                expanded=(i == 0),
+                            ):
+                                pillars = node.get("pillars", {})
+                                atmosphere = node.get("atmosphere", {})
+                                overflow = node.get("overflow", [])
+
+                                # One markdown call per node: cards, atmosphere, gems, source.
+                                # Every field is transcript/LLM text, so all of it is escaped.
+                                html_parts = [
+                                    STORY_CARD.format(v=_escape(pillars.get("intervention_narrative", "—"))),
+                                    ACTION_CARD.format(v=_escape(pillars.get("intervention_action", "—"))),
+                                    SHIFT_CARD.format(v=_escape(pillars.get("intervention_shift", "—"))),
+                                    META_ROW.format(
+                                        tone=_escape(atmosphere.get("tone", "—")),
+                                        pacing=_escape(atmosphere.get("pacing", "—")),
+                                    ),
+                                ]
+                                if overflow:
+                                    tags = " ".join(
+                                        GEM_TAG.format(v=_escape(phrase))
+                                        for phrase in overflow[:MAX_GEM_TAGS]
+                                    )
+                                    if len(overflow) > MAX_GEM_TAGS:
+                                        tags += " " + GEM_TAG.format(v=f"+{len(overflow) - MAX_GEM_TAGS} more")
+                                    html_parts.append(GEMS_BLOCK.format(tags=tags))
+                                html_parts.append(
+                                    SOURCE_LINE.format(url=_escape(node.get("video_url", "")))
+                                )
+                                st.markdown("".join(html_parts), unsafe_allow_html=True)
 
+                except httpx.HTTPStatusError as exc:
+                    st.error(f"API Error {exc.response.status_code}: {exc.response.text}")
+                except httpx.PoolTimeout:
+                    st.error(POOL_TIMEOUT_MESSAGE)
                 except httpx.ConnectError:
                     st.error("Cannot reach the FastAPI server.  \n`uvicorn app.main:app --reload`")
                 except Exception as exc: